@@ -3,25 +3,40 @@ Trap CRM - FOG / Grease Trap Service Management System
 A Salesforce-style dashboard built with Streamlit.
 """
 
+import csv
+import io
 import json
 import sys
-from datetime import datetime, timedelta
+from collections import deque
+from collections.abc import Callable, Collection
+from functools import wraps
 from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
 from uuid import UUID
 
-import pandas as pd
 import streamlit as st
 
+# pandas is imported inside the pages that chart or export data, so pages
+# that never build a DataFrame don't pay its import cost on a cold start.
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Add src/ to path for engine imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from trap.models import (
+    RECORD_FIELD_NAMES,
     SERVICE_RECORD_FIELDS,
     Customer,
+    DashboardKPIs,
     Job,
     JobStatus,
+    TimeSeriesPoint,
+    parse_gallons,
+    parse_money,
 )
-from trap.parse import parse_text_to_record
+from trap.parse import ParseResult, parse_text_to_record
 from trap.storage import (
     count_customers,
     count_jobs,
@@ -38,13 +53,25 @@ from trap.storage import (
     get_unique_technicians,
     init_db,
     list_customers,
+    list_customers_summary,
     list_jobs,
+    list_jobs_summary,
     load_job,
     save_customer,
     save_job,
     update_customer,
     update_job,
 )
+from trap.ui.components import (
+    format_currency,
+    format_date,
+    format_number,
+    get_date_range,
+    kpi_grid,
+    page_header,
+    status_badge,
+)
+from trap.ui.styles import inject_styles
 
 # --- PAGE CONFIG ---
 st.set_page_config(
@@ -54,196 +81,344 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Initialize database
-init_db()
+
+# Initialize database once per server process; the script body itself
+# re-executes on every rerun.
+@st.cache_resource
+def _ensure_db() -> bool:
+    """Create/migrate the database schema."""
+    init_db()
+    return True
+
+
+_ensure_db()
 
 # --- PATHS ---
-ASSETS_DIR = Path(__file__).parent / "assets"
-VIDEO_PATH = ASSETS_DIR / "bg.mp4"
 FIXTURES_DIR = Path(__file__).parent / "tests" / "fixtures"
 
+# Service record field labels, plain and as form labels ("*" marks required)
+_FIELD_LABELS = {name: label for name, label, _, _ in SERVICE_RECORD_FIELDS}
+_FIELD_DISPLAY_LABELS = {
+    name: f"{label} *" if required else label
+    for name, label, _, required in SERVICE_RECORD_FIELDS
+}
+
+# Field/Value grid columns for the parse review editor
+_PARSE_GRID_COLUMNS = {
+    "Field": st.column_config.TextColumn("Field", disabled=True),
+    "Value": st.column_config.TextColumn("Value"),
+}
+
 
 # =============================================================================
-# STYLES
+# HELPER FUNCTIONS
 # =============================================================================
 
 
-def inject_styles():
-    st.markdown(
-        """
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
-
-        :root {
-            --primary: #6366f1;
-            --accent: #22d3ee;
-            --success: #10b981;
-            --warning: #f59e0b;
-            --danger: #ef4444;
-            --bg-dark: #0f172a;
-            --bg-card: rgba(30, 41, 59, 0.8);
-            --bg-glass: rgba(30, 41, 59, 0.7);
-            --text-primary: #f1f5f9;
-            --text-secondary: #94a3b8;
-            --border: rgba(148, 163, 184, 0.2);
-        }
+@st.cache_data(show_spinner=False)
+def _list_fixtures() -> list[Path]:
+    """List sample invoice fixtures (cached; the directory rarely changes)."""
+    return sorted(FIXTURES_DIR.glob("*.txt")) if FIXTURES_DIR.exists() else []
 
-        .stApp { font-family: 'Inter', sans-serif; }
 
-        #MainMenu, footer, header { visibility: hidden; }
-        .stDeployButton { display: none; }
+@st.cache_data(show_spinner=False)
+def _sample_options() -> dict[str, str]:
+    """Sample picker options keyed by fixture stem (cached)."""
+    return {"": "Select sample..."} | {f.stem: f.stem for f in _list_fixtures()}
 
-        [data-testid="stSidebar"] {
-            background: linear-gradient(180deg, #0f172a 0%, #1e293b 100%);
-            border-right: 1px solid var(--border);
-        }
 
-        .nav-logo {
-            font-size: 1.75rem;
-            font-weight: 800;
-            background: linear-gradient(135deg, #fff 0%, var(--accent) 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            text-align: center;
-            margin-bottom: 1rem;
-        }
+@st.cache_data(show_spinner=False)
+def _read_fixture(name: str) -> str:
+    """Read a sample invoice fixture by stem (cached)."""
+    return (FIXTURES_DIR / f"{name}.txt").read_text(errors="replace")
 
-        .page-header {
-            font-size: 2rem;
-            font-weight: 700;
-            color: var(--text-primary);
-            margin-bottom: 0.5rem;
-        }
 
-        .page-subtitle {
-            color: var(--text-secondary);
-            margin-bottom: 1.5rem;
-        }
+@st.cache_data(max_entries=32, show_spinner=False)
+def _decode_upload(file_id: str, _data: bytes) -> str:
+    """Decode an uploaded file once per upload (keyed on file_id only)."""
+    return _data.decode("utf-8", errors="replace")
 
-        .kpi-card {
-            background: var(--bg-card);
-            border: 1px solid var(--border);
-            border-radius: 16px;
-            padding: 1.25rem;
-            text-align: center;
-        }
 
-        .kpi-value {
-            font-size: 2rem;
-            font-weight: 700;
-            color: var(--text-primary);
-        }
+@st.cache_data(max_entries=128, show_spinner=False)
+def _cached_parse(text: str) -> ParseResult:
+    """Parse invoice text, reusing the result for identical input."""
+    return parse_text_to_record(text)
 
-        .kpi-label {
-            font-size: 0.75rem;
-            color: var(--text-secondary);
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-        }
-
-        .kpi-success { color: var(--success); }
-        .kpi-warning { color: var(--warning); }
-        .kpi-danger { color: var(--danger); }
-        .kpi-primary { color: var(--primary); }
-        .kpi-accent { color: var(--accent); }
-
-        .status-badge {
-            display: inline-block;
-            padding: 0.25rem 0.75rem;
-            border-radius: 9999px;
-            font-size: 0.75rem;
-            font-weight: 600;
-            text-transform: uppercase;
-        }
 
-        .status-scheduled { background: rgba(99, 102, 241, 0.2); color: #6366f1; }
-        .status-in-progress { background: rgba(245, 158, 11, 0.2); color: #f59e0b; }
-        .status-completed { background: rgba(16, 185, 129, 0.2); color: #10b981; }
-        .status-verified { background: rgba(34, 211, 238, 0.2); color: #22d3ee; }
-        .status-invoiced { background: rgba(168, 85, 247, 0.2); color: #a855f7; }
-        .status-draft { background: rgba(148, 163, 184, 0.2); color: #94a3b8; }
-
-        .card {
-            background: var(--bg-card);
-            border: 1px solid var(--border);
-            border-radius: 16px;
-            padding: 1.5rem;
-            margin-bottom: 1rem;
-        }
+def _timed(name: str) -> Callable[[Callable], Callable]:
+    """Record each call's duration (seconds) in st.session_state["_perf"].
 
-        .card-title {
-            font-size: 1.25rem;
-            font-weight: 600;
-            color: var(--text-primary);
-            margin-bottom: 1rem;
-        }
+    Applied under st.cache_data, so only cache misses (real queries) are timed.
+    """
 
-        .stButton > button {
-            background: linear-gradient(135deg, var(--primary) 0%, #4f46e5 100%);
-            color: white;
-            border: none;
-            padding: 0.75rem 1.5rem;
-            font-weight: 600;
-            border-radius: 10px;
-        }
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings = st.session_state.setdefault("_perf", {})
+                timings.setdefault(name, deque(maxlen=200)).append(
+                    perf_counter() - start
+                )
 
-        .stTextInput input, .stTextArea textarea, .stSelectbox select {
-            background: rgba(30, 41, 59, 0.8) !important;
-            border: 1px solid var(--border) !important;
-            color: var(--text-primary) !important;
-        }
-    </style>
-    """,
-        unsafe_allow_html=True,
+        return wrapper
+
+    return decorator
+
+
+def _render_perf_panel() -> None:
+    """Show recorded query timings in the sidebar (enabled from Settings)."""
+    timings = st.session_state.get("_perf", {})
+    with st.sidebar.expander("Perf", expanded=True):
+        if not timings:
+            st.caption("No timed queries yet")
+            return
+        summary = {}
+        for name, samples in sorted(timings.items()):
+            ordered = sorted(samples)
+            summary[name] = {
+                "n": len(ordered),
+                "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))] * 1000, 2),
+            }
+        st.json(summary)
+
+
+# Analytics and list queries are cached per filter tuple for a few minutes;
+# every write below calls _clear_data_caches() so saved changes show up
+# immediately.
+_ANALYTICS_CACHE = {"ttl": 300, "max_entries": 128, "show_spinner": False}
+
+
+@st.cache_data(**_ANALYTICS_CACHE)
+@_timed("kpis")
+def _cached_kpis(
+    date_from: str | None,
+    date_to: str | None,
+    customer_id: str | None = None,
+    technician: str | None = None,
+) -> DashboardKPIs:
+    """Dashboard KPIs for a filter tuple."""
+    return get_dashboard_kpis(
+        date_from=date_from,
+        date_to=date_to,
+        customer_id=customer_id,
+        technician=technician,
     )
 
 
-# =============================================================================
-# HELPER FUNCTIONS
-# =============================================================================
+@st.cache_data(**_ANALYTICS_CACHE)
+@_timed("jobs_by_date")
+def _cached_jobs_by_date(date_from: str, date_to: str) -> "pd.DataFrame":
+    points = get_jobs_by_date(date_from, date_to, group_by="day")
+    return _series_frame(points, "Jobs")
 
 
-def get_date_range(preset: str) -> tuple[str, str]:
-    """Get date range from preset."""
-    today = datetime.now()
-    if preset == "Last 7 Days":
-        start = today - timedelta(days=7)
-    elif preset == "Last 30 Days":
-        start = today - timedelta(days=30)
-    elif preset == "Last 90 Days":
-        start = today - timedelta(days=90)
-    elif preset == "Year to Date":
-        start = datetime(today.year, 1, 1)
-    else:
-        start = today - timedelta(days=30)
+@st.cache_data(**_ANALYTICS_CACHE)
+@_timed("revenue_by_date")
+def _cached_revenue_by_date(date_from: str, date_to: str) -> "pd.DataFrame":
+    points = get_revenue_by_date(date_from, date_to, group_by="day")
+    return _series_frame(points, "Revenue")
+
 
-    return start.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
+@st.cache_data(**_ANALYTICS_CACHE)
+@_timed("gallons_by_date")
+def _cached_gallons_by_date(date_from: str, date_to: str) -> "pd.DataFrame":
+    points = get_gallons_by_date(date_from, date_to, group_by="day")
+    return _series_frame(points, "Gallons")
 
 
-def format_currency(value: float) -> str:
-    """Format number as currency."""
-    return f"${value:,.2f}"
+@st.cache_data(**_ANALYTICS_CACHE)
+@_timed("jobs_by_status")
+def _cached_jobs_by_status(date_from: str, date_to: str) -> dict[str, int]:
+    return get_jobs_by_status(date_from, date_to)
 
 
-def format_number(value: float) -> str:
-    """Format number with commas."""
-    if value >= 1000:
-        return f"{value:,.0f}"
-    return f"{value:.1f}"
+@st.cache_data(**_ANALYTICS_CACHE)
+@_timed("jobs_by_technician")
+def _cached_jobs_by_technician(date_from: str, date_to: str) -> dict[str, int]:
+    return get_jobs_by_technician(date_from, date_to)
 
 
-def get_status_class(status: str) -> str:
-    """Get CSS class for status badge."""
-    status_map = {
-        "Scheduled": "scheduled",
-        "In Progress": "in-progress",
-        "Completed": "completed",
-        "Verified": "verified",
-        "Invoiced": "invoiced",
-        "Draft": "draft",
-        "Exported": "verified",
+@st.cache_data(**_ANALYTICS_CACHE)
+@_timed("top_customers")
+def _cached_top_customers(
+    limit: int, date_from: str, date_to: str
+) -> list[tuple[str, float]]:
+    return get_top_customers_by_revenue(
+        limit=limit, date_from=date_from, date_to=date_to
+    )
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_customer_ids() -> dict[str, str]:
+    """Map customer name to id for the dashboard filter (first match wins)."""
+    name_to_id: dict[str, str] = {}
+    for customer in list_customers_summary(limit=100):
+        name_to_id.setdefault(customer.name, customer.customer_id)
+    return name_to_id
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_technicians() -> list[str]:
+    """Distinct technician names for the filter dropdowns."""
+    return get_unique_technicians()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_jobs_table(
+    status_value: str | None,
+    technician: str | None,
+    search: str | None,
+    date_from: str | None,
+    date_to: str | None,
+    limit: int,
+    offset: int = 0,
+) -> dict[str, list]:
+    """Jobs page table columns for a filter tuple (status passed as its value).
+
+    Display strings are formatted here, once per cache miss, rather than on
+    every rerun of the Jobs page.
+    """
+    jobs = list_jobs_summary(
+        status=JobStatus(status_value) if status_value else None,
+        technician=technician,
+        search=search,
+        date_from=date_from,
+        date_to=date_to,
+        limit=limit,
+        offset=offset,
+    )
+    return {
+        "Invoice #": [j.invoice_number or "—" for j in jobs],
+        "Customer": [j.customer_name or "—" for j in jobs],
+        "Date": [format_date(j.service_date) for j in jobs],
+        "Total": [j.get_invoice_total_display() for j in jobs],
+        "Status": [j.status.value for j in jobs],
+        "Id": [j.job_id for j in jobs],
     }
-    return f"status-{status_map.get(status, 'draft')}"
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_customer_names() -> dict[str, str]:
+    """Map customer id to name for the job form's customer picker."""
+    return {c.customer_id: c.name for c in list_customers_summary(limit=100)}
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _jobs_csv(date_from: str, date_to: str) -> bytes | None:
+    """CSV export of jobs in a date range, or None when there are none."""
+    import pandas as pd
+
+    jobs = list_jobs(date_from=date_from, date_to=date_to, limit=1000)
+    if not jobs:
+        return None
+    return pd.DataFrame([j.to_dict() for j in jobs]).to_csv(index=False).encode()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _customers_csv() -> bytes | None:
+    """CSV export of active customers, or None when there are none."""
+    import pandas as pd
+
+    customers = list_customers(limit=1000)
+    if not customers:
+        return None
+    return pd.DataFrame([c.to_dict() for c in customers]).to_csv(index=False).encode()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_counts() -> tuple[int, int, int]:
+    """Customer, site and job counts for the Settings page."""
+    return count_customers(), count_sites(), count_jobs()
+
+
+def _clear_data_caches() -> None:
+    """Drop cached queries after any customer or job write."""
+    for cached in (
+        _cached_kpis,
+        _cached_jobs_by_date,
+        _cached_revenue_by_date,
+        _cached_gallons_by_date,
+        _cached_jobs_by_status,
+        _cached_jobs_by_technician,
+        _cached_top_customers,
+        _cached_customer_ids,
+        _cached_technicians,
+        _cached_jobs_table,
+        _cached_customer_names,
+        _jobs_csv,
+        _customers_csv,
+        _cached_counts,
+    ):
+        cached.clear()
+
+
+def _record_csv(record: dict) -> str:
+    """Serialize a single record dict as a CSV header + row."""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=list(record), lineterminator="\n")
+    writer.writeheader()
+    writer.writerow(record)
+    return buf.getvalue()
+
+
+def _series_frame(points: list[TimeSeriesPoint], column: str) -> "pd.DataFrame":
+    """Build a Date-indexed chart frame from time series points."""
+    import pandas as pd
+
+    return pd.DataFrame(
+        {column: [p.value for p in points]},
+        index=pd.Index([p.date for p in points], name="Date"),
+    )
+
+
+def _bar_frame(
+    pairs: Collection[tuple[str, float]], label: str, column: str
+) -> "pd.DataFrame":
+    """Build a label-indexed bar chart frame from (label, value) pairs."""
+    import pandas as pd
+
+    labels, values = zip(*pairs, strict=True) if pairs else ((), ())
+    return pd.DataFrame({column: values}, index=pd.Index(labels, name=label))
+
+
+def _selectable_table(columns: dict[str, list], key: str) -> str | None:
+    """Render rows as one single-select dataframe; return the picked row's Id.
+
+    ``columns`` must include an ``Id`` column, which is hidden from view.
+    """
+    import pandas as pd
+
+    df = pd.DataFrame(columns)
+    event = st.dataframe(
+        df,
+        column_config={"Id": None},
+        hide_index=True,
+        use_container_width=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key=key,
+    )
+    selected = event.selection.rows
+    return df["Id"].iat[selected[0]] if selected else None
+
+
+def _set_state(**values) -> None:
+    """Button callback: write session state before the click's own rerun.
+
+    Callbacks run ahead of the script, so the page renders the new state on
+    the automatic rerun without a second ``st.rerun()`` pass.
+    """
+    st.session_state.update(values)
+
+
+def _open_job(job_id: str) -> None:
+    """Navigate to the job detail page for ``job_id``."""
+    st.session_state.current_job_id = job_id
+    st.session_state.current_page = "Job Detail"
+    st.rerun()
 
 
 # =============================================================================
@@ -252,12 +427,20 @@ def get_status_class(status: str) -> str:
 
 
 def page_dashboard():
-    st.markdown('<h1 class="page-header">Dashboard</h1>', unsafe_allow_html=True)
-    st.markdown(
-        '<p class="page-subtitle">Overview of your service operations</p>',
-        unsafe_allow_html=True,
-    )
+    page_header("Dashboard", "Overview of your service operations")
+
+    # Filters, KPIs and charts rerun on their own when a filter changes; the
+    # recent jobs list is a separate fragment so neither re-queries the other.
+    _dashboard_body()
+
+    st.markdown("---")
+    st.markdown("### Recent Jobs")
+    _dashboard_recent_jobs()
+
 
+@st.fragment
+def _dashboard_body():
+    """Render the dashboard filters, KPI cards and charts."""
     # Filters row
     col1, col2, col3, col4 = st.columns([2, 2, 2, 2])
 
@@ -269,13 +452,12 @@ def page_dashboard():
             key="dash_date",
         )
     with col2:
-        customers = list_customers(limit=100)
-        customer_options = ["All Customers"] + [c.name for c in customers]
+        name_to_id = _cached_customer_ids()
         selected_customer = st.selectbox(
-            "Customer", customer_options, key="dash_customer"
+            "Customer", ["All Customers", *name_to_id], key="dash_customer"
         )
     with col3:
-        technicians = ["All Technicians"] + get_unique_technicians()
+        technicians = ["All Technicians", *_cached_technicians()]
         selected_tech = st.selectbox("Technician", technicians, key="dash_tech")
     with col4:
         st.write("")  # Spacer
@@ -284,141 +466,45 @@ def page_dashboard():
     date_from, date_to = get_date_range(date_preset)
 
     # Get filter values
-    customer_id = None
-    if selected_customer != "All Customers":
-        for c in customers:
-            if c.name == selected_customer:
-                customer_id = c.customer_id
-                break
+    customer_id = name_to_id.get(selected_customer)
 
     technician = None if selected_tech == "All Technicians" else selected_tech
 
     # Get KPIs
-    kpis = get_dashboard_kpis(
-        date_from=date_from,
-        date_to=date_to,
-        customer_id=customer_id,
-        technician=technician,
+    kpis = _cached_kpis(
+        date_from,
+        date_to,
+        customer_id,
+        technician,
     )
 
-    # KPI Cards - Row 1
+    # KPI cards: one HTML grid, six per row
     st.markdown("### Key Metrics")
-    k1, k2, k3, k4, k5, k6 = st.columns(6)
-
-    with k1:
-        st.markdown(
-            f"""
-            <div class="kpi-card">
-                <div class="kpi-value kpi-success">{kpis.jobs_completed}</div>
-                <div class="kpi-label">Jobs Completed</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    with k2:
-        st.markdown(
-            f"""
-            <div class="kpi-card">
-                <div class="kpi-value kpi-primary">{kpis.jobs_scheduled}</div>
-                <div class="kpi-label">Jobs Scheduled</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    with k3:
-        st.markdown(
-            f"""
-            <div class="kpi-card">
-                <div class="kpi-value kpi-accent">{format_currency(kpis.total_revenue)}</div>
-                <div class="kpi-label">Total Revenue</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    with k4:
-        st.markdown(
-            f"""
-            <div class="kpi-card">
-                <div class="kpi-value">{format_number(kpis.total_gallons)}</div>
-                <div class="kpi-label">Gallons Pumped</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    with k5:
-        st.markdown(
-            f"""
-            <div class="kpi-card">
-                <div class="kpi-value">{format_currency(kpis.avg_revenue_per_job)}</div>
-                <div class="kpi-label">Avg Revenue/Job</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    with k6:
-        color = "kpi-danger" if kpis.overdue_services > 0 else "kpi-success"
-        st.markdown(
-            f"""
-            <div class="kpi-card">
-                <div class="kpi-value {color}">{kpis.overdue_services}</div>
-                <div class="kpi-label">Overdue Services</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    # KPI Cards - Row 2
-    k7, k8, k9, k10 = st.columns(4)
-
-    with k7:
-        st.markdown(
-            f"""
-            <div class="kpi-card">
-                <div class="kpi-value">{kpis.customer_count}</div>
-                <div class="kpi-label">Active Customers</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    with k8:
-        st.markdown(
-            f"""
-            <div class="kpi-card">
-                <div class="kpi-value">{kpis.site_count}</div>
-                <div class="kpi-label">Active Sites</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    with k9:
-        st.markdown(
-            f"""
-            <div class="kpi-card">
-                <div class="kpi-value">{format_number(kpis.avg_gallons_per_job)}</div>
-                <div class="kpi-label">Avg Gallons/Job</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    with k10:
-        color = "kpi-warning" if kpis.docs_missing_count > 0 else "kpi-success"
-        st.markdown(
-            f"""
-            <div class="kpi-card">
-                <div class="kpi-value {color}">{kpis.docs_missing_count}</div>
-                <div class="kpi-label">Missing Docs</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+    overdue_color = "kpi-danger" if kpis.overdue_services > 0 else "kpi-success"
+    docs_color = "kpi-warning" if kpis.docs_missing_count > 0 else "kpi-success"
+    kpi_grid(
+        [
+            (str(kpis.jobs_completed), "Jobs Completed", "kpi-success"),
+            (str(kpis.jobs_scheduled), "Jobs Scheduled", "kpi-primary"),
+            (
+                format_currency(kpis.total_revenue_cents),
+                "Total Revenue",
+                "kpi-accent",
+            ),
+            (format_number(kpis.total_gallons), "Gallons Pumped", ""),
+            (
+                format_currency(kpis.avg_revenue_per_job_cents),
+                "Avg Revenue/Job",
+                "",
+            ),
+            (str(kpis.overdue_services), "Overdue Services", overdue_color),
+            (str(kpis.customer_count), "Active Customers", ""),
+            (str(kpis.site_count), "Active Sites", ""),
+            (format_number(kpis.avg_gallons_per_job), "Avg Gallons/Job", ""),
+            (str(kpis.docs_missing_count), "Missing Docs", docs_color),
+        ],
+        columns=6,
+    )
 
     st.markdown("---")
 
@@ -427,21 +513,17 @@ def page_dashboard():
 
     with chart1:
         st.markdown("### Jobs Over Time")
-        jobs_data = get_jobs_by_date(date_from, date_to, group_by="day")
-        if jobs_data:
-            df = pd.DataFrame([{"Date": p.date, "Jobs": p.value} for p in jobs_data])
-            st.line_chart(df.set_index("Date"))
+        jobs_data = _cached_jobs_by_date(date_from, date_to)
+        if not jobs_data.empty:
+            st.line_chart(jobs_data)
         else:
             st.info("No job data for selected period")
 
     with chart2:
         st.markdown("### Revenue Over Time")
-        revenue_data = get_revenue_by_date(date_from, date_to, group_by="day")
-        if revenue_data:
-            df = pd.DataFrame(
-                [{"Date": p.date, "Revenue": p.value} for p in revenue_data]
-            )
-            st.line_chart(df.set_index("Date"))
+        revenue_data = _cached_revenue_by_date(date_from, date_to)
+        if not revenue_data.empty:
+            st.line_chart(revenue_data)
         else:
             st.info("No revenue data for selected period")
 
@@ -449,53 +531,38 @@ def page_dashboard():
 
     with chart3:
         st.markdown("### Jobs by Status")
-        status_data = get_jobs_by_status(date_from, date_to)
+        status_data = _cached_jobs_by_status(date_from, date_to)
         if status_data:
-            df = pd.DataFrame(
-                [{"Status": k, "Count": v} for k, v in status_data.items()]
-            )
-            st.bar_chart(df.set_index("Status"))
+            st.bar_chart(_bar_frame(status_data.items(), "Status", "Count"))
         else:
             st.info("No status data for selected period")
 
     with chart4:
         st.markdown("### Top Customers by Revenue")
-        top_customers = get_top_customers_by_revenue(
-            limit=5, date_from=date_from, date_to=date_to
-        )
+        top_customers = _cached_top_customers(5, date_from, date_to)
         if top_customers:
-            df = pd.DataFrame(
-                [{"Customer": name, "Revenue": rev} for name, rev in top_customers]
-            )
-            st.bar_chart(df.set_index("Customer"))
+            st.bar_chart(_bar_frame(top_customers, "Customer", "Revenue"))
         else:
             st.info("No customer data for selected period")
 
-    # Recent activity
-    st.markdown("---")
-    st.markdown("### Recent Jobs")
 
-    recent_jobs = list_jobs(limit=10)
+@st.fragment
+def _dashboard_recent_jobs():
+    """Render the recent jobs list; selecting a row opens the job."""
+    recent_jobs = list_jobs_summary(limit=10)
     if recent_jobs:
-        for job in recent_jobs:
-            status_class = get_status_class(job.status.value)
-            col1, col2, col3, col4, col5 = st.columns([2, 3, 2, 1.5, 1.5])
-            with col1:
-                st.write(job.invoice_number or "—")
-            with col2:
-                st.write(job.customer_name or "—")
-            with col3:
-                st.write(job.service_date or "—")
-            with col4:
-                st.markdown(
-                    f'<span class="status-badge {status_class}">{job.status.value}</span>',
-                    unsafe_allow_html=True,
-                )
-            with col5:
-                if st.button("View", key=f"dash_job_{job.job_id}"):
-                    st.session_state.current_job_id = str(job.job_id)
-                    st.session_state.current_page = "Job Detail"
-                    st.rerun()
+        job_id = _selectable_table(
+            {
+                "Invoice": [j.invoice_number or "—" for j in recent_jobs],
+                "Customer": [j.customer_name or "—" for j in recent_jobs],
+                "Date": [format_date(j.service_date) for j in recent_jobs],
+                "Status": [j.status.value for j in recent_jobs],
+                "Id": [j.job_id for j in recent_jobs],
+            },
+            key="dash_recent_jobs",
+        )
+        if job_id:
+            _open_job(job_id)
     else:
         st.info("No recent jobs")
 
@@ -506,97 +573,132 @@ def page_dashboard():
 
 
 def page_customers():
-    st.markdown('<h1 class="page-header">Customers</h1>', unsafe_allow_html=True)
-    st.markdown(
-        '<p class="page-subtitle">Manage your customer accounts</p>',
-        unsafe_allow_html=True,
-    )
+    page_header("Customers", "Manage your customer accounts")
 
     # Action buttons
     col1, col2 = st.columns([1, 5])
     with col1:
-        if st.button("+ New Customer", use_container_width=True):
-            st.session_state.current_page = "New Customer"
-            st.rerun()
+        st.button(
+            "+ New Customer",
+            use_container_width=True,
+            on_click=_set_state,
+            kwargs={"current_page": "New Customer"},
+        )
+
+    _customer_list()
 
-    # Search
-    search = st.text_input(
-        "Search customers", placeholder="Name, email...", key="cust_search"
-    )
+
+@st.fragment
+def _customer_list():
+    """Render the customer search box and results."""
+    page_size = 50
+
+    # Search only runs on submit, not on every keystroke
+    with st.form("cust_search_form", clear_on_submit=False, border=False):
+        scol1, scol2 = st.columns([5, 1], vertical_alignment="bottom")
+        with scol1:
+            search = st.text_input(
+                "Search customers", placeholder="Name, email...", key="cust_search"
+            )
+        with scol2:
+            # A new search starts from the first page of its own results
+            st.form_submit_button(
+                "Search",
+                use_container_width=True,
+                on_click=_set_state,
+                kwargs={"cust_page": 1},
+            )
+
+    page = st.number_input("Page", min_value=1, step=1, key="cust_page")
 
     # List customers
-    customers = list_customers(search=search if search else None, limit=50)
+    customers = list_customers_summary(
+        search=search or None, limit=page_size, offset=(page - 1) * page_size
+    )
 
     if not customers:
-        st.info("No customers found. Create your first customer!")
+        if page > 1:
+            st.info("No more customers on this page")
+        else:
+            st.info("No customers found. Create your first customer!")
         return
 
     # Customer table
-    for customer in customers:
-        col1, col2, col3, col4, col5 = st.columns([3, 2, 2, 2, 1])
+    selected_id = _selectable_table(
+        {
+            "Name": [c.name for c in customers],
+            "Phone": [c.phone or "—" for c in customers],
+            "Email": [c.email or "—" for c in customers],
+            "City": [c.city or "—" for c in customers],
+            "Id": [c.customer_id for c in customers],
+        },
+        key="cust_table",
+    )
+    if selected_id:
+        st.session_state.current_customer_id = selected_id
+        st.session_state.current_page = "Customer Detail"
+        st.rerun()
 
-        with col1:
-            st.write(f"**{customer.name}**")
-        with col2:
-            st.write(customer.phone or "—")
-        with col3:
-            st.write(customer.email or "—")
-        with col4:
-            st.write(customer.city or "—")
-        with col5:
-            if st.button("View", key=f"cust_{customer.customer_id}"):
-                st.session_state.current_customer_id = str(customer.customer_id)
-                st.session_state.current_page = "Customer Detail"
-                st.rerun()
 
+def _customer_form(customer: Customer | None, key_prefix: str) -> dict:
+    """
+    Render the customer fields inside the current st.form.
 
-def page_new_customer():
-    st.markdown('<h1 class="page-header">New Customer</h1>', unsafe_allow_html=True)
+    Fields are prefilled from ``customer`` when given and keyed under
+    ``key_prefix``. Returns the values by Customer field name, with blank
+    inputs as None.
+    """
 
-    with st.form("new_customer_form"):
-        col1, col2 = st.columns(2)
+    def field(name: str, label: str, widget=st.text_input) -> str:
+        value = (getattr(customer, name) or "") if customer else ""
+        return widget(label, value=value, key=f"{key_prefix}_{name}")
 
-        with col1:
-            name = st.text_input("Business Name *")
-            legal_name = st.text_input("Legal Name")
-            phone = st.text_input("Phone")
-            email = st.text_input("Email")
+    col1, col2 = st.columns(2)
 
-        with col2:
-            service_address = st.text_input("Service Address")
-            city = st.text_input("City")
-            state = st.text_input("State")
-            zip_code = st.text_input("ZIP Code")
+    with col1:
+        values = {
+            "name": field("name", "Business Name *"),
+            "legal_name": field("legal_name", "Legal Name"),
+            "phone": field("phone", "Phone"),
+            "email": field("email", "Email"),
+        }
 
-        billing_address = st.text_input("Billing Address")
-        notes = st.text_area("Notes")
+    with col2:
+        values["service_address"] = field("service_address", "Service Address")
+        values["city"] = field("city", "City")
+        values["state"] = field("state", "State")
+        values["zip_code"] = field("zip_code", "ZIP Code")
+
+    values["billing_address"] = field("billing_address", "Billing Address")
+    values["notes"] = field("notes", "Notes", widget=st.text_area)
+
+    return {name: value or None for name, value in values.items()}
+
+
+def page_new_customer():
+    page_header("New Customer")
+
+    with st.form("new_customer_form"):
+        values = _customer_form(None, "new_customer")
 
         col1, col2 = st.columns(2)
         with col1:
             submitted = st.form_submit_button("Save Customer", use_container_width=True)
         with col2:
-            if st.form_submit_button("Cancel", use_container_width=True):
-                st.session_state.current_page = "Customers"
-                st.rerun()
+            st.form_submit_button(
+                "Cancel",
+                use_container_width=True,
+                on_click=_set_state,
+                kwargs={"current_page": "Customers"},
+            )
 
         if submitted:
-            if not name:
+            if not values["name"]:
                 st.error("Business name is required")
             else:
-                customer = Customer(
-                    name=name,
-                    legal_name=legal_name or None,
-                    phone=phone or None,
-                    email=email or None,
-                    service_address=service_address or None,
-                    city=city or None,
-                    state=state or None,
-                    zip_code=zip_code or None,
-                    billing_address=billing_address or None,
-                    notes=notes or None,
-                )
-                save_customer(customer)
-                st.success(f"Customer '{name}' created!")
+                save_customer(Customer(**values))
+                _clear_data_caches()
+                st.success(f"Customer '{values['name']}' created!")
                 st.session_state.current_page = "Customers"
                 st.rerun()
 
@@ -615,66 +717,36 @@ def page_customer_detail():
     # Header
     col1, col2 = st.columns([4, 1])
     with col1:
-        st.markdown(
-            f'<h1 class="page-header">{customer.name}</h1>', unsafe_allow_html=True
-        )
+        page_header(customer.name)
     with col2:
-        if st.button("Back to Customers"):
-            st.session_state.current_page = "Customers"
-            st.rerun()
+        st.button(
+            "Back to Customers",
+            on_click=_set_state,
+            kwargs={"current_page": "Customers"},
+        )
 
     # Edit mode toggle
-    if "customer_edit_mode" not in st.session_state:
-        st.session_state.customer_edit_mode = False
+    st.session_state.setdefault("customer_edit_mode", False)
 
-    if st.button("Edit" if not st.session_state.customer_edit_mode else "Cancel Edit"):
-        st.session_state.customer_edit_mode = not st.session_state.customer_edit_mode
-        st.rerun()
+    st.button(
+        "Edit" if not st.session_state.customer_edit_mode else "Cancel Edit",
+        on_click=_set_state,
+        kwargs={"customer_edit_mode": not st.session_state.customer_edit_mode},
+    )
 
     if st.session_state.customer_edit_mode:
         with st.form("edit_customer_form"):
-            col1, col2 = st.columns(2)
-
-            with col1:
-                name = st.text_input("Business Name *", value=customer.name)
-                legal_name = st.text_input(
-                    "Legal Name", value=customer.legal_name or ""
-                )
-                phone = st.text_input("Phone", value=customer.phone or "")
-                email = st.text_input("Email", value=customer.email or "")
-
-            with col2:
-                service_address = st.text_input(
-                    "Service Address", value=customer.service_address or ""
-                )
-                city = st.text_input("City", value=customer.city or "")
-                state = st.text_input("State", value=customer.state or "")
-                zip_code = st.text_input("ZIP Code", value=customer.zip_code or "")
-
-            billing_address = st.text_input(
-                "Billing Address", value=customer.billing_address or ""
-            )
-            notes = st.text_area("Notes", value=customer.notes or "")
+            values = _customer_form(customer, f"edit_customer_{customer_id}")
 
             if st.form_submit_button("Save Changes", use_container_width=True):
-                update_customer(
-                    customer_id,
-                    {
-                        "name": name,
-                        "legal_name": legal_name or None,
-                        "phone": phone or None,
-                        "email": email or None,
-                        "service_address": service_address or None,
-                        "city": city or None,
-                        "state": state or None,
-                        "zip_code": zip_code or None,
-                        "billing_address": billing_address or None,
-                        "notes": notes or None,
-                    },
-                )
-                st.success("Customer updated!")
-                st.session_state.customer_edit_mode = False
-                st.rerun()
+                if not values["name"]:
+                    st.error("Business name is required")
+                else:
+                    update_customer(customer_id, values)
+                    _clear_data_caches()
+                    st.success("Customer updated!")
+                    st.session_state.customer_edit_mode = False
+                    st.rerun()
     else:
         # Display customer info
         col1, col2 = st.columns(2)
@@ -699,25 +771,19 @@ def page_customer_detail():
     st.markdown("---")
     st.markdown("### Recent Jobs")
 
-    jobs = list_jobs(customer_id=customer_id, limit=20)
+    jobs = list_jobs_summary(customer_id=customer_id, limit=20)
     if jobs:
-        for job in jobs:
-            col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
-            with col1:
-                st.write(job.invoice_number or "—")
-            with col2:
-                st.write(job.service_date or "—")
-            with col3:
-                status_class = get_status_class(job.status.value)
-                st.markdown(
-                    f'<span class="status-badge {status_class}">{job.status.value}</span>',
-                    unsafe_allow_html=True,
-                )
-            with col4:
-                if st.button("View", key=f"cust_job_{job.job_id}"):
-                    st.session_state.current_job_id = str(job.job_id)
-                    st.session_state.current_page = "Job Detail"
-                    st.rerun()
+        job_id = _selectable_table(
+            {
+                "Invoice": [j.invoice_number or "—" for j in jobs],
+                "Date": [format_date(j.service_date) for j in jobs],
+                "Status": [j.status.value for j in jobs],
+                "Id": [j.job_id for j in jobs],
+            },
+            key="cust_jobs_table",
+        )
+        if job_id:
+            _open_job(job_id)
     else:
         st.info("No jobs for this customer yet")
 
@@ -728,44 +794,52 @@ def page_customer_detail():
 
 
 def page_jobs():
-    st.markdown('<h1 class="page-header">Jobs</h1>', unsafe_allow_html=True)
-    st.markdown(
-        '<p class="page-subtitle">Manage service jobs and work orders</p>',
-        unsafe_allow_html=True,
-    )
+    page_header("Jobs", "Manage service jobs and work orders")
 
     # Action buttons
     col1, col2, col3 = st.columns([1, 1, 4])
     with col1:
-        if st.button("+ New Job", use_container_width=True):
-            st.session_state.current_page = "New Job"
-            st.rerun()
+        st.button(
+            "+ New Job",
+            use_container_width=True,
+            on_click=_set_state,
+            kwargs={"current_page": "New Job"},
+        )
     with col2:
-        if st.button("Parse Invoice", use_container_width=True):
-            st.session_state.current_page = "Parse Job"
-            st.rerun()
+        st.button(
+            "Parse Invoice",
+            use_container_width=True,
+            on_click=_set_state,
+            kwargs={"current_page": "Parse Job"},
+        )
 
-    # Filters
-    col1, col2, col3, col4 = st.columns(4)
+    # Filters apply together on submit instead of rerunning per keystroke
+    with st.form("jobs_filters", clear_on_submit=False, border=False):
+        col1, col2, col3, col4 = st.columns(4)
 
-    with col1:
-        search = st.text_input(
-            "Search", placeholder="Invoice # or customer...", key="jobs_search"
-        )
+        with col1:
+            search = st.text_input(
+                "Search", placeholder="Invoice # or customer...", key="jobs_search"
+            )
 
-    with col2:
-        status_options = ["All"] + [s.value for s in JobStatus]
-        status_filter = st.selectbox("Status", status_options, key="jobs_status")
+        with col2:
+            status_options = ["All"] + [s.value for s in JobStatus]
+            status_filter = st.selectbox("Status", status_options, key="jobs_status")
 
-    with col3:
-        technicians = ["All"] + get_unique_technicians()
-        tech_filter = st.selectbox("Technician", technicians, key="jobs_tech")
+        with col3:
+            technicians = ["All", *_cached_technicians()]
+            tech_filter = st.selectbox("Technician", technicians, key="jobs_tech")
 
-    with col4:
-        date_preset = st.selectbox(
-            "Date Range",
-            ["All Time", "Last 7 Days", "Last 30 Days", "Last 90 Days"],
-            key="jobs_date",
+        with col4:
+            date_preset = st.selectbox(
+                "Date Range",
+                ["All Time", "Last 7 Days", "Last 30 Days", "Last 90 Days"],
+                key="jobs_date",
+            )
+
+        # New filters start from the first page of their own results
+        st.form_submit_button(
+            "Apply Filters", on_click=_set_state, kwargs={"jobs_page": 1}
         )
 
     # Build filters
@@ -775,67 +849,34 @@ def page_jobs():
     if date_preset != "All Time":
         date_from, date_to = get_date_range(date_preset)
 
-    # List jobs
-    jobs = list_jobs(
-        status=status,
-        technician=technician,
-        search=search if search else None,
-        date_from=date_from,
-        date_to=date_to,
-        limit=50,
+    # List jobs, one page at a time
+    page_size = 50
+    page = st.number_input("Page", min_value=1, step=1, key="jobs_page")
+    table = _cached_jobs_table(
+        status.value if status else None,
+        technician,
+        search or None,
+        date_from,
+        date_to,
+        page_size,
+        (page - 1) * page_size,
     )
 
-    if not jobs:
-        st.info("No jobs found")
+    if not table["Id"]:
+        st.info("No more jobs on this page" if page > 1 else "No jobs found")
         return
 
-    # Jobs table header
-    hcol1, hcol2, hcol3, hcol4, hcol5, hcol6 = st.columns([1.5, 2.5, 1.5, 1.5, 1, 1])
-    with hcol1:
-        st.markdown("**Invoice #**")
-    with hcol2:
-        st.markdown("**Customer**")
-    with hcol3:
-        st.markdown("**Date**")
-    with hcol4:
-        st.markdown("**Total**")
-    with hcol5:
-        st.markdown("**Status**")
-    with hcol6:
-        st.markdown("**Action**")
-
-    for job in jobs:
-        col1, col2, col3, col4, col5, col6 = st.columns([1.5, 2.5, 1.5, 1.5, 1, 1])
-
-        with col1:
-            st.write(job.invoice_number or "—")
-        with col2:
-            st.write(job.customer_name or "—")
-        with col3:
-            st.write(job.get_service_date_display())
-        with col4:
-            st.write(job.get_invoice_total_display())
-        with col5:
-            status_class = get_status_class(job.status.value)
-            st.markdown(
-                f'<span class="status-badge {status_class}">{job.status.value}</span>',
-                unsafe_allow_html=True,
-            )
-        with col6:
-            if st.button("View", key=f"job_{job.job_id}"):
-                st.session_state.current_job_id = str(job.job_id)
-                st.session_state.current_page = "Job Detail"
-                st.rerun()
+    job_id = _selectable_table(table, key="jobs_table")
+    if job_id:
+        _open_job(job_id)
 
 
 def page_new_job():
-    st.markdown('<h1 class="page-header">New Job</h1>', unsafe_allow_html=True)
+    page_header("New Job")
 
     with st.form("new_job_form"):
         # Customer selection
-        customers = list_customers(limit=100)
-        customer_options = {str(c.customer_id): c.name for c in customers}
-        customer_options = {"": "Select Customer..."} | customer_options
+        customer_options = {"": "Select Customer..."} | _cached_customer_names()
         selected_customer = st.selectbox(
             "Customer",
             options=list(customer_options.keys()),
@@ -868,31 +909,17 @@ def page_new_job():
         with col1:
             submitted = st.form_submit_button("Save Job", use_container_width=True)
         with col2:
-            if st.form_submit_button("Cancel", use_container_width=True):
-                st.session_state.current_page = "Jobs"
-                st.rerun()
+            st.form_submit_button(
+                "Cancel",
+                use_container_width=True,
+                on_click=_set_state,
+                kwargs={"current_page": "Jobs"},
+            )
 
         if submitted:
             if not invoice_number:
                 st.error("Invoice number is required")
             else:
-                # Parse typed values from string inputs
-                gallons_float = None
-                if gallons_pumped:
-                    try:
-                        val = gallons_pumped.lower().replace("gallons", "").replace("gal", "").replace(",", "").strip()
-                        gallons_float = float(val)
-                    except ValueError:
-                        pass
-
-                invoice_cents = None
-                if invoice_total:
-                    try:
-                        val = invoice_total.replace("$", "").replace(",", "").strip()
-                        invoice_cents = int(float(val) * 100)
-                    except ValueError:
-                        pass
-
                 job = Job(
                     customer_id=UUID(selected_customer) if selected_customer else None,
                     invoice_number=invoice_number,
@@ -902,17 +929,18 @@ def page_new_job():
                     customer_address=customer_address or None,
                     technician=technician or None,
                     truck_id=truck_id or None,
-                    gallons_pumped=gallons_float,
+                    gallons_pumped=parse_gallons(gallons_pumped),
                     gallons_pumped_str=gallons_pumped or None,
                     trap_size=trap_size or None,
                     disposal_facility=disposal_facility or None,
-                    invoice_total_cents=invoice_cents,
+                    invoice_total_cents=parse_money(invoice_total),
                     invoice_total_str=invoice_total or None,
                     manifest_number=manifest_number or None,
                     notes=notes or None,
                     status=JobStatus(status),
                 )
                 save_job(job)
+                _clear_data_caches()
                 st.success(f"Job '{invoice_number}' created!")
                 st.session_state.current_page = "Jobs"
                 st.rerun()
@@ -920,40 +948,35 @@ def page_new_job():
 
 def page_parse_job():
     """Parse invoice and create job."""
-    st.markdown('<h1 class="page-header">Parse Invoice</h1>', unsafe_allow_html=True)
-    st.markdown(
-        '<p class="page-subtitle">Upload or paste invoice text to extract data</p>',
-        unsafe_allow_html=True,
-    )
+    page_header("Parse Invoice", "Upload or paste invoice text to extract data")
 
     # Initialize session state
-    if "parse_stage" not in st.session_state:
-        st.session_state.parse_stage = "input"
-    if "parsed_job" not in st.session_state:
-        st.session_state.parsed_job = None
+    st.session_state.setdefault("parse_stage", "input")
+    st.session_state.setdefault("parsed_job", None)
+    st.session_state.setdefault("parse_token", None)
 
+    # Each stage is a fragment, so typing or picking a sample only reruns that
+    # stage; stage transitions call st.rerun() to rerun the whole app.
     if st.session_state.parse_stage == "input":
         _render_parse_input()
     else:
         _render_parse_edit()
 
 
+@st.fragment
 def _render_parse_input():
     """Render parse input stage."""
-    sample_files = sorted(FIXTURES_DIR.glob("*.txt")) if FIXTURES_DIR.exists() else []
-    sample_options = {"": "Select sample..."} | {f.stem: f.stem for f in sample_files}
+    sample_options = _sample_options()
 
     sample_choice = st.selectbox(
         "Load sample invoice",
         options=list(sample_options.keys()),
-        format_func=lambda x: sample_options[x] if x else "Select sample...",
+        format_func=sample_options.get,
     )
 
     default_text = ""
     if sample_choice:
-        sample_path = FIXTURES_DIR / f"{sample_choice}.txt"
-        if sample_path.exists():
-            default_text = sample_path.read_text(errors="replace")
+        default_text = _read_fixture(sample_choice)
 
     input_text = st.text_area(
         "Invoice text",
@@ -965,16 +988,31 @@ def _render_parse_input():
     uploaded = st.file_uploader("Or upload a file", type=["txt"])
     source_filename = None
     if uploaded:
-        input_text = uploaded.read().decode("utf-8", errors="replace")
+        input_text = _decode_upload(uploaded.file_id, uploaded.getvalue())
         source_filename = uploaded.name
 
+    # Going "Back" keeps the last parsed job; re-parsing identical input
+    # resumes it instead of rebuilding a fresh Job from scratch.
+    if st.session_state.parsed_job is not None and st.button(
+        "Resume Last Review", use_container_width=True
+    ):
+        st.session_state.parse_stage = "edit"
+        st.rerun()
+
     col1, col2 = st.columns(2)
     with col1:
         if st.button("Parse & Continue", use_container_width=True):
             if input_text.strip():
-                result = parse_text_to_record(input_text)
-                job = Job.from_parse_result(result, source_filename=source_filename)
-                st.session_state.parsed_job = job
+                token = hash((input_text, source_filename))
+                if (
+                    st.session_state.parsed_job is None
+                    or st.session_state.parse_token != token
+                ):
+                    result = _cached_parse(input_text)
+                    st.session_state.parsed_job = Job.from_parse_result(
+                        result, source_filename=source_filename
+                    )
+                    st.session_state.parse_token = token
                 st.session_state.parse_stage = "edit"
                 st.rerun()
             else:
@@ -985,86 +1023,53 @@ def _render_parse_input():
             st.rerun()
 
 
+@st.fragment
 def _render_parse_edit():
     """Render parse edit stage."""
     job = st.session_state.parsed_job
 
     # Metrics
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        color = (
-            "kpi-success"
-            if job.confidence_score >= 70
-            else "kpi-warning"
-            if job.confidence_score >= 40
-            else "kpi-danger"
-        )
-        st.markdown(
-            f"""
-            <div class="kpi-card">
-                <div class="kpi-value {color}">{job.confidence_score}%</div>
-                <div class="kpi-label">Confidence</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-    with col2:
-        st.markdown(
-            f"""
-            <div class="kpi-card">
-                <div class="kpi-value">{len(job.extracted_fields)}</div>
-                <div class="kpi-label">Fields Found</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-    with col3:
-        st.markdown(
-            f"""
-            <div class="kpi-card">
-                <div class="kpi-value">{len(job.missing_fields)}</div>
-                <div class="kpi-label">Fields Missing</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+    color = (
+        "kpi-success"
+        if job.confidence_score >= 70
+        else "kpi-warning"
+        if job.confidence_score >= 40
+        else "kpi-danger"
+    )
+    kpi_grid(
+        [
+            (f"{job.confidence_score}%", "Confidence", color),
+            (str(len(job.extracted_fields)), "Fields Found", ""),
+            (str(len(job.missing_fields)), "Fields Missing", ""),
+        ]
+    )
 
     st.markdown("### Review & Edit")
 
-    with st.form("parse_edit_form"):
-        edited_values = {}
-
-        col1, col2 = st.columns(2)
-        fields_left = SERVICE_RECORD_FIELDS[: len(SERVICE_RECORD_FIELDS) // 2]
-        fields_right = SERVICE_RECORD_FIELDS[len(SERVICE_RECORD_FIELDS) // 2 :]
-
-        with col1:
-            for field_name, label, input_type, required in fields_left:
-                current_value = getattr(job, field_name) or ""
-                is_missing = field_name in job.missing_fields
-                display_label = f"{label} *" if required else label
-                if is_missing and required:
-                    display_label = f"⚠️ {display_label}"
-
-                if input_type == "textarea":
-                    new_value = st.text_area(display_label, value=current_value)
-                else:
-                    new_value = st.text_input(display_label, value=current_value)
-                edited_values[field_name] = new_value if new_value.strip() else None
+    import pandas as pd
+
+    # One Field/Value grid instead of a text widget per service record field
+    grid = pd.DataFrame(
+        {
+            "Field": [
+                f"⚠️ {_FIELD_DISPLAY_LABELS[name]}"
+                if required and name in job.missing_fields
+                else _FIELD_DISPLAY_LABELS[name]
+                for name, _, _, required in SERVICE_RECORD_FIELDS
+            ],
+            "Value": [job.get_record_field_text(name) for name in RECORD_FIELD_NAMES],
+        }
+    )
 
-        with col2:
-            for field_name, label, input_type, required in fields_right:
-                current_value = getattr(job, field_name) or ""
-                is_missing = field_name in job.missing_fields
-                display_label = f"{label} *" if required else label
-                if is_missing and required:
-                    display_label = f"⚠️ {display_label}"
-
-                if input_type == "textarea":
-                    new_value = st.text_area(display_label, value=current_value)
-                else:
-                    new_value = st.text_input(display_label, value=current_value)
-                edited_values[field_name] = new_value if new_value.strip() else None
+    with st.form("parse_edit_form"):
+        edited = st.data_editor(
+            grid,
+            column_config=_PARSE_GRID_COLUMNS,
+            hide_index=True,
+            num_rows="fixed",
+            use_container_width=True,
+            key="parse_edit_grid",
+        )
 
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -1078,19 +1083,18 @@ def _render_parse_edit():
 
     if go_back:
         st.session_state.parse_stage = "input"
-        st.session_state.parsed_job = None
         st.rerun()
 
     if save_draft or save_verify:
-        for field_name, value in edited_values.items():
-            setattr(job, field_name, value)
+        # Rows keep SERVICE_RECORD_FIELDS order (the grid is fixed-size)
+        for field_name, value in zip(RECORD_FIELD_NAMES, edited["Value"], strict=True):
+            text = value.strip() if isinstance(value, str) else ""
+            job.set_record_field_text(field_name, text or None)
 
         if save_verify:
             missing = job.get_missing_required_fields()
             if missing:
-                labels = [
-                    lbl for name, lbl, _, _ in SERVICE_RECORD_FIELDS if name in missing
-                ]
+                labels = [_FIELD_LABELS[name] for name in missing]
                 st.error(f"Missing required fields: {', '.join(labels)}")
                 return
             job.status = JobStatus.VERIFIED
@@ -1098,9 +1102,11 @@ def _render_parse_edit():
             job.status = JobStatus.DRAFT
 
         save_job(job)
+        _clear_data_caches()
         st.success(f"Job saved as {job.status.value}!")
         st.session_state.parse_stage = "input"
         st.session_state.parsed_job = None
+        st.session_state.parse_token = None
         st.session_state.current_page = "Jobs"
         st.rerun()
 
@@ -1120,32 +1126,22 @@ def page_job_detail():
     # Header
     col1, col2 = st.columns([4, 1])
     with col1:
-        st.markdown(
-            f'<h1 class="page-header">{job.invoice_number or "Job Details"}</h1>',
-            unsafe_allow_html=True,
-        )
-        status_class = get_status_class(job.status.value)
-        st.markdown(
-            f'<span class="status-badge {status_class}">{job.status.value}</span>',
-            unsafe_allow_html=True,
-        )
+        page_header(job.invoice_number or "Job Details")
+        status_badge(job.status.value)
     with col2:
-        if st.button("Back to Jobs"):
-            st.session_state.current_page = "Jobs"
-            st.rerun()
+        st.button("Back to Jobs", on_click=_set_state, kwargs={"current_page": "Jobs"})
 
     # Edit mode
-    if "job_edit_mode" not in st.session_state:
-        st.session_state.job_edit_mode = False
+    st.session_state.setdefault("job_edit_mode", False)
 
     col1, col2, col3 = st.columns([1, 1, 1])
     with col1:
-        if st.button(
+        st.button(
             "Edit" if not st.session_state.job_edit_mode else "Cancel",
             use_container_width=True,
-        ):
-            st.session_state.job_edit_mode = not st.session_state.job_edit_mode
-            st.rerun()
+            on_click=_set_state,
+            kwargs={"job_edit_mode": not st.session_state.job_edit_mode},
+        )
 
     if st.session_state.job_edit_mode:
         _render_job_edit_form(job)
@@ -1188,6 +1184,7 @@ def _render_job_view(job: Job):
             if st.button("Mark Verified", use_container_width=True):
                 if job.can_verify():
                     update_job(job.job_id, {"status": JobStatus.VERIFIED})
+                    _clear_data_caches()
                     st.success("Job verified!")
                     st.rerun()
                 else:
@@ -1196,17 +1193,17 @@ def _render_job_view(job: Job):
     with col2:
         st.download_button(
             "Export JSON",
-            data=json.dumps(job.to_dict(), indent=2),
+            # Serialized only when the button is clicked, not on every rerun
+            data=lambda: json.dumps(job.to_dict(), indent=2),
             file_name=f"{job.invoice_number or 'job'}.json",
             mime="application/json",
             use_container_width=True,
         )
 
     with col3:
-        csv_data = pd.DataFrame([job.get_record_dict()]).to_csv(index=False)
         st.download_button(
             "Export CSV",
-            data=csv_data,
+            data=lambda: _record_csv(job.get_record_dict()),
             file_name=f"{job.invoice_number or 'job'}.csv",
             mime="text/csv",
             use_container_width=True,
@@ -1222,79 +1219,94 @@ def _render_job_view(job: Job):
         with dcol1:
             if st.button("Yes, Delete", use_container_width=True):
                 delete_job(job.job_id)
+                _clear_data_caches()
                 st.session_state.confirm_delete = False
                 st.session_state.current_page = "Jobs"
                 st.rerun()
         with dcol2:
-            if st.button("Cancel", use_container_width=True):
-                st.session_state.confirm_delete = False
-                st.rerun()
+            st.button(
+                "Cancel",
+                use_container_width=True,
+                on_click=_set_state,
+                kwargs={"confirm_delete": False},
+            )
 
 
 def _render_job_edit_form(job: Job):
     """Render job edit form."""
-    # Get string values for display in form
-    service_date_val = job.service_date_str or (job.service_date.isoformat() if job.service_date else "")
-    gallons_val = job.gallons_pumped_str or (f"{job.gallons_pumped:,.0f}" if job.gallons_pumped else "")
-    invoice_val = job.invoice_total_str or (f"${job.invoice_total_cents/100:,.2f}" if job.invoice_total_cents else "")
+    # Field values as shown in the form; the diff on save is against these
+    before = {name: job.get_record_field_text(name) for name in RECORD_FIELD_NAMES}
 
     with st.form("edit_job_form"):
         col1, col2 = st.columns(2)
 
         with col1:
             invoice_number = st.text_input(
-                "Invoice Number *", value=job.invoice_number or ""
+                "Invoice Number *", value=before["invoice_number"]
             )
-            service_date = st.text_input("Service Date *", value=service_date_val)
+            service_date = st.text_input("Service Date *", value=before["service_date"])
             customer_name = st.text_input(
-                "Customer Name *", value=job.customer_name or ""
+                "Customer Name *", value=before["customer_name"]
             )
             customer_address = st.text_input(
-                "Address", value=job.customer_address or ""
+                "Address", value=before["customer_address"]
             )
-            phone = st.text_input("Phone", value=job.phone or "")
-            technician = st.text_input("Technician", value=job.technician or "")
+            phone = st.text_input("Phone", value=before["phone"])
+            technician = st.text_input("Technician", value=before["technician"])
 
         with col2:
-            trap_size = st.text_input("Trap Size", value=job.trap_size or "")
-            gallons_pumped = st.text_input("Gallons Pumped", value=gallons_val)
+            trap_size = st.text_input("Trap Size", value=before["trap_size"])
+            gallons_pumped = st.text_input(
+                "Gallons Pumped", value=before["gallons_pumped"]
+            )
             disposal_facility = st.text_input(
-                "Disposal Facility", value=job.disposal_facility or ""
+                "Disposal Facility", value=before["disposal_facility"]
+            )
+            invoice_total = st.text_input(
+                "Invoice Total", value=before["invoice_total"]
             )
-            invoice_total = st.text_input("Invoice Total", value=invoice_val)
             manifest_number = st.text_input(
-                "Manifest #", value=job.manifest_number or ""
+                "Manifest #", value=before["manifest_number"]
             )
-            truck_id = st.text_input("Truck ID", value=job.truck_id or "")
+            truck_id = st.text_input("Truck ID", value=before["truck_id"])
 
-        notes = st.text_area("Notes", value=job.notes or "")
+        notes = st.text_area("Notes", value=before["notes"])
 
         status_options = [s.value for s in JobStatus]
         current_idx = status_options.index(job.status.value)
         status = st.selectbox("Status", status_options, index=current_idx)
 
         if st.form_submit_button("Save Changes", use_container_width=True):
-            # The update_job function will handle string values in the database
-            # which will be parsed back to typed values on load
-            update_job(
-                job.job_id,
-                {
-                    "invoice_number": invoice_number or None,
-                    "service_date": service_date or None,
-                    "customer_name": customer_name or None,
-                    "customer_address": customer_address or None,
-                    "phone": phone or None,
-                    "technician": technician or None,
-                    "trap_size": trap_size or None,
-                    "gallons_pumped": gallons_pumped or None,
-                    "disposal_facility": disposal_facility or None,
-                    "invoice_total": invoice_total or None,
-                    "manifest_number": manifest_number or None,
-                    "truck_id": truck_id or None,
-                    "notes": notes or None,
-                    "status": status,
-                },
-            )
+            after = {
+                "invoice_number": invoice_number,
+                "service_date": service_date,
+                "customer_name": customer_name,
+                "customer_address": customer_address,
+                "phone": phone,
+                "technician": technician,
+                "trap_size": trap_size,
+                "gallons_pumped": gallons_pumped,
+                "disposal_facility": disposal_facility,
+                "invoice_total": invoice_total,
+                "manifest_number": manifest_number,
+                "truck_id": truck_id,
+                "notes": notes,
+            }
+            # Only send edited fields; typed values are re-parsed from text
+            changes = {
+                name: value or None
+                for name, value in after.items()
+                if value != before[name]
+            }
+            if status != job.status.value:
+                changes["status"] = status
+
+            if not changes:
+                st.info("No changes to save")
+                return
+
+            update_job(job.job_id, changes)
+            _clear_data_caches()
             st.success("Job updated!")
             st.session_state.job_edit_mode = False
             st.rerun()
@@ -1306,11 +1318,9 @@ def _render_job_edit_form(job: Job):
 
 
 def page_reports():
-    st.markdown('<h1 class="page-header">Reports</h1>', unsafe_allow_html=True)
-    st.markdown(
-        '<p class="page-subtitle">Analytics and performance reports</p>',
-        unsafe_allow_html=True,
-    )
+    import pandas as pd
+
+    page_header("Reports", "Analytics and performance reports")
 
     # Date range
     col1, col2, col3 = st.columns([2, 2, 2])
@@ -1324,7 +1334,7 @@ def page_reports():
     date_from, date_to = get_date_range(date_preset)
 
     # Summary stats
-    kpis = get_dashboard_kpis(date_from=date_from, date_to=date_to)
+    kpis = _cached_kpis(date_from, date_to)
 
     st.markdown("### Summary")
     col1, col2, col3, col4 = st.columns(4)
@@ -1332,65 +1342,57 @@ def page_reports():
     with col1:
         st.metric("Total Jobs", kpis.jobs_completed + kpis.jobs_scheduled)
     with col2:
-        st.metric("Total Revenue", format_currency(kpis.total_revenue))
+        st.metric("Total Revenue", format_currency(kpis.total_revenue_cents))
     with col3:
         st.metric("Total Gallons", format_number(kpis.total_gallons))
     with col4:
-        st.metric("Avg per Job", format_currency(kpis.avg_revenue_per_job))
+        st.metric("Avg per Job", format_currency(kpis.avg_revenue_per_job_cents))
 
     st.markdown("---")
 
-    # Charts
-    tab1, tab2, tab3 = st.tabs(["Jobs", "Revenue", "Technicians"])
+    # Charts: only the selected section is queried and drawn (st.tabs would
+    # build all three on every rerun)
+    section = st.radio(
+        "Section",
+        ["Jobs", "Revenue", "Technicians"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="reports_section",
+    )
 
-    with tab1:
+    if section == "Jobs":
         st.markdown("### Jobs by Status")
-        status_data = get_jobs_by_status(date_from, date_to)
+        status_data = _cached_jobs_by_status(date_from, date_to)
         if status_data:
-            df = pd.DataFrame(
-                [{"Status": k, "Count": v} for k, v in status_data.items()]
-            )
-            st.bar_chart(df.set_index("Status"))
+            st.bar_chart(_bar_frame(status_data.items(), "Status", "Count"))
 
         st.markdown("### Jobs Over Time")
-        jobs_data = get_jobs_by_date(date_from, date_to, group_by="day")
-        if jobs_data:
-            df = pd.DataFrame([{"Date": p.date, "Jobs": p.value} for p in jobs_data])
-            st.line_chart(df.set_index("Date"))
+        jobs_data = _cached_jobs_by_date(date_from, date_to)
+        if not jobs_data.empty:
+            st.line_chart(jobs_data)
 
-    with tab2:
+    elif section == "Revenue":
         st.markdown("### Revenue Over Time")
-        revenue_data = get_revenue_by_date(date_from, date_to, group_by="day")
-        if revenue_data:
-            df = pd.DataFrame(
-                [{"Date": p.date, "Revenue": p.value} for p in revenue_data]
-            )
-            st.line_chart(df.set_index("Date"))
+        revenue_data = _cached_revenue_by_date(date_from, date_to)
+        if not revenue_data.empty:
+            st.line_chart(revenue_data)
 
         st.markdown("### Gallons Over Time")
-        gallons_data = get_gallons_by_date(date_from, date_to, group_by="day")
-        if gallons_data:
-            df = pd.DataFrame(
-                [{"Date": p.date, "Gallons": p.value} for p in gallons_data]
-            )
-            st.line_chart(df.set_index("Date"))
+        gallons_data = _cached_gallons_by_date(date_from, date_to)
+        if not gallons_data.empty:
+            st.line_chart(gallons_data)
 
-    with tab3:
+    else:
         st.markdown("### Jobs by Technician")
-        tech_data = get_jobs_by_technician(date_from, date_to)
+        tech_data = _cached_jobs_by_technician(date_from, date_to)
         if tech_data:
-            df = pd.DataFrame(
-                [{"Technician": k, "Jobs": v} for k, v in tech_data.items()]
-            )
-            st.bar_chart(df.set_index("Technician"))
+            st.bar_chart(_bar_frame(tech_data.items(), "Technician", "Jobs"))
 
         st.markdown("### Top Customers")
-        top_customers = get_top_customers_by_revenue(
-            limit=10, date_from=date_from, date_to=date_to
-        )
+        top_customers = _cached_top_customers(10, date_from, date_to)
         if top_customers:
-            df = pd.DataFrame(
-                [{"Customer": name, "Revenue": rev} for name, rev in top_customers]
+            df = pd.DataFrame.from_records(
+                top_customers, columns=["Customer", "Revenue"]
             )
             st.dataframe(df, use_container_width=True, hide_index=True)
 
@@ -1400,24 +1402,22 @@ def page_reports():
 
     col1, col2 = st.columns(2)
     with col1:
-        jobs = list_jobs(date_from=date_from, date_to=date_to, limit=1000)
-        if jobs:
-            jobs_df = pd.DataFrame([j.to_dict() for j in jobs])
+        jobs_csv = _jobs_csv(date_from, date_to)
+        if jobs_csv:
             st.download_button(
                 "Export Jobs CSV",
-                data=jobs_df.to_csv(index=False),
+                data=jobs_csv,
                 file_name=f"jobs_{date_from}_{date_to}.csv",
                 mime="text/csv",
                 use_container_width=True,
             )
 
     with col2:
-        customers = list_customers(limit=1000)
-        if customers:
-            cust_df = pd.DataFrame([c.to_dict() for c in customers])
+        customers_csv = _customers_csv()
+        if customers_csv:
             st.download_button(
                 "Export Customers CSV",
-                data=cust_df.to_csv(index=False),
+                data=customers_csv,
                 file_name="customers.csv",
                 mime="text/csv",
                 use_container_width=True,
@@ -1430,15 +1430,18 @@ def page_reports():
 
 
 def page_settings():
-    st.markdown('<h1 class="page-header">Settings</h1>', unsafe_allow_html=True)
+    page_header("Settings")
+
+    st.checkbox("Show query timings in the sidebar", key="show_perf")
 
     st.markdown("### Database")
     col1, col2 = st.columns(2)
 
     with col1:
-        st.write(f"Customers: {count_customers()}")
-        st.write(f"Sites: {count_sites()}")
-        st.write(f"Jobs: {count_jobs()}")
+        n_customers, n_sites, n_jobs = _cached_counts()
+        st.write(f"Customers: {n_customers}")
+        st.write(f"Sites: {n_sites}")
+        st.write(f"Jobs: {n_jobs}")
 
     with col2:
         if st.button("Reset Database", type="secondary"):
@@ -1452,13 +1455,14 @@ def page_settings():
                     from trap.storage import reset_db
 
                     reset_db()
+                    _clear_data_caches()
                     st.session_state.confirm_reset = False
                     st.success("Database reset!")
                     st.rerun()
             with dcol2:
-                if st.button("Cancel Reset"):
-                    st.session_state.confirm_reset = False
-                    st.rerun()
+                st.button(
+                    "Cancel Reset", on_click=_set_state, kwargs={"confirm_reset": False}
+                )
 
     st.markdown("---")
     st.markdown("### About")
@@ -1474,9 +1478,18 @@ def page_settings():
 def main():
     inject_styles()
 
-    # Initialize page state
+    # Initialize page state; a ?job_id= link opens that job on session start
     if "current_page" not in st.session_state:
-        st.session_state.current_page = "Dashboard"
+        linked_job_id = st.query_params.get("job_id")
+        if linked_job_id:
+            st.session_state.current_job_id = linked_job_id
+            st.session_state.current_page = "Job Detail"
+        else:
+            st.session_state.current_page = "Dashboard"
+
+    # The timings toggle is a keyed widget on the Settings page; reassigning
+    # the key keeps its value when other pages run without the widget
+    st.session_state.show_perf = st.session_state.get("show_perf", False)
 
     # Sidebar navigation
     with st.sidebar:
@@ -1490,10 +1503,11 @@ def main():
             "Settings",
         ]
 
+        # The sidebar renders before routing, so a click is picked up in
+        # the same run without an extra st.rerun().
         for nav in nav_options:
             if st.button(nav, key=f"nav_{nav}", use_container_width=True):
                 st.session_state.current_page = nav
-                st.rerun()
 
         st.markdown("---")
         st.markdown(
@@ -1516,11 +1530,21 @@ def main():
     }
 
     current = st.session_state.current_page
+
+    # Mirror the open job into the URL so job pages can be bookmarked/shared
+    if current == "Job Detail" and st.session_state.get("current_job_id"):
+        st.query_params["job_id"] = st.session_state.current_job_id
+    elif "job_id" in st.query_params:
+        del st.query_params["job_id"]
+
     if current in pages:
         pages[current]()
     else:
         page_dashboard()
 
+    if st.session_state.show_perf:
+        _render_perf_panel()
+
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,8 @@
 """Main entrypoint for Trap."""
 
 import argparse
+import shutil
+import sys
 from pathlib import Path
 
 
@@ -14,9 +16,12 @@ def main() -> None:
         if not args.input.exists():
             print(f"Error: File not found: {args.input}")
             return
-        content = args.input.read_text()
-        print(f"Read {len(content)} characters from {args.input}")
-        print(content)
+        # Stream the file to stdout instead of decoding it into one string
+        print(f"Read {args.input.stat().st_size} bytes from {args.input}")
+        sys.stdout.flush()
+        with args.input.open("rb") as f:
+            shutil.copyfileobj(f, sys.stdout.buffer)
+        print()
     else:
         print("Hello from Trap!")
 
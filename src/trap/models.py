@@ -14,13 +14,19 @@ Data Typing:
 - Gallons stored as float
 """
 
-from dataclasses import asdict, dataclass, field
+import re
+from dataclasses import dataclass, field, fields
 from datetime import date, datetime
 from enum import Enum
-from typing import Any
+from functools import cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
-from .parse import ParseResult
+# parse imports the serialization helpers from here, so this import is for
+# annotations only
+if TYPE_CHECKING:
+    from .parse import ParseResult
 
 
 # =============================================================================
@@ -84,12 +90,34 @@ class PaymentStatus(str, Enum):
     OVERDUE = "Overdue"
 
 
+# =============================================================================
+# SERIALIZATION HELPERS
+# =============================================================================
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Dataclass field names, looked up once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _shallow_dict(obj: Any) -> dict:
+    """
+    Field name -> value dict for a dataclass instance.
+
+    Unlike dataclasses.asdict this does not deepcopy every value; to_dict()
+    methods overwrite the non-atomic fields (UUIDs, dates, enums) anyway and
+    copy any mutable containers they return.
+    """
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
+
+
 # =============================================================================
 # CUSTOMER
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Customer:
     """
     A customer/business that receives grease trap services.
@@ -114,7 +142,7 @@ class Customer:
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dictionary."""
-        d = asdict(self)
+        d = _shallow_dict(self)
         d["customer_id"] = str(self.customer_id)
         d["created_at"] = self.created_at.isoformat()
         d["updated_at"] = self.updated_at.isoformat()
@@ -145,7 +173,7 @@ class Customer:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Site:
     """
     A specific service location for a customer.
@@ -179,7 +207,7 @@ class Site:
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dictionary."""
-        d = asdict(self)
+        d = _shallow_dict(self)
         d["site_id"] = str(self.site_id)
         d["customer_id"] = str(self.customer_id) if self.customer_id else None
         d["created_at"] = self.created_at.isoformat()
@@ -218,7 +246,7 @@ class Site:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Asset:
     """
     A grease trap or interceptor at a site.
@@ -246,7 +274,7 @@ class Asset:
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dictionary."""
-        d = asdict(self)
+        d = _shallow_dict(self)
         d["asset_id"] = str(self.asset_id)
         d["site_id"] = str(self.site_id) if self.site_id else None
         d["created_at"] = self.created_at.isoformat()
@@ -292,8 +320,70 @@ SERVICE_RECORD_FIELDS = [
 # Just the field names for convenience
 RECORD_FIELD_NAMES = [f[0] for f in SERVICE_RECORD_FIELDS]
 
+# Reads every service record field of a Job in one call
+_get_record_values = attrgetter(*RECORD_FIELD_NAMES)
+
+# A whole money amount: "1250", "1250.", "1250.5", ".50" (at least one digit)
+_AMOUNT_RE = re.compile(r"([-+]?)(?=\.?\d)(\d*)(?:\.(\d*))?")
+
+# Unit words and thousands separators dropped before parsing a gallons value
+_GALLONS_UNIT_RE = re.compile(r"gallons|gal", re.IGNORECASE)
+_STRIP_COMMAS = str.maketrans("", "", ",")
+# Currency symbol and thousands separators dropped before parsing an amount
+_STRIP_MONEY = str.maketrans("", "", "$,")
+
+# Accepted service date shapes and the strptime formats to try for each, so a
+# value is only parsed with formats its shape can match
+_DATE_DISPATCH = [
+    (re.compile(r"\d{4}-\d{1,2}-\d{1,2}"), ("%Y-%m-%d",)),
+    (re.compile(r"\d{1,2}/\d{1,2}/\d{4}"), ("%m/%d/%Y",)),
+    (re.compile(r"\d{1,2}-\d{1,2}-\d{4}"), ("%m-%d-%Y",)),
+    (re.compile(r"[A-Za-z]+\s+\d{1,2},\s+\d{4}"), ("%B %d, %Y", "%b %d, %Y")),
+]
 
-@dataclass
+
+def parse_gallons(value: str | None) -> float | None:
+    """Parse gallons string to float."""
+    if not value:
+        return None
+    val = _GALLONS_UNIT_RE.sub("", value).translate(_STRIP_COMMAS).strip()
+    try:
+        return float(val)
+    except ValueError:
+        return None
+
+
+def parse_money(value: str | None) -> int | None:
+    """Parse money string to cents (the whole string must be an amount)."""
+    if not value:
+        return None
+    match = _AMOUNT_RE.fullmatch(value.translate(_STRIP_MONEY).strip())
+    if not match:
+        return None
+    # Work on the digits directly so "19.99" is exactly 1999 cents with no
+    # float rounding; digits past the cents place are truncated
+    sign, whole, frac = match.groups()
+    cents = int(whole or "0") * 100 + int(((frac or "") + "00")[:2])
+    return -cents if sign == "-" else cents
+
+
+def parse_date(value: str | None) -> date | None:
+    """Parse date string to date object."""
+    if not value:
+        return None
+    value = value.strip()
+    for pattern, formats in _DATE_DISPATCH:
+        if pattern.fullmatch(value):
+            for fmt in formats:
+                try:
+                    return datetime.strptime(value, fmt).date()
+                except ValueError:
+                    continue
+            return None
+    return None
+
+
+@dataclass(slots=True)
 class Job:
     """
     A service event / job record.
@@ -347,7 +437,7 @@ class Job:
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dictionary."""
-        d = asdict(self)
+        d = _shallow_dict(self)
         d["job_id"] = str(self.job_id)
         d["customer_id"] = str(self.customer_id) if self.customer_id else None
         d["site_id"] = str(self.site_id) if self.site_id else None
@@ -359,6 +449,8 @@ class Job:
         if self.service_date:
             d["service_date"] = self.service_date.isoformat()
         d["status"] = self.status.value
+        d["extracted_fields"] = list(self.extracted_fields)
+        d["missing_fields"] = list(self.missing_fields)
         # Include formatted values for convenience
         d["invoice_total"] = self.get_invoice_total_display()
         d["gallons_display"] = self.get_gallons_display()
@@ -366,7 +458,7 @@ class Job:
 
     @classmethod
     def from_parse_result(
-        cls, result: ParseResult, source_filename: str | None = None
+        cls, result: "ParseResult", source_filename: str | None = None
     ) -> "Job":
         """Create a Job from a ParseResult."""
         record = result.record
@@ -388,48 +480,11 @@ class Job:
             notes=record.notes,
         )
         # Parse typed values
-        job.gallons_pumped = job._parse_gallons(record.gallons_pumped)
-        job.invoice_total_cents = job._parse_money(record.invoice_total)
-        job.service_date = job._parse_date(record.service_date)
+        job.gallons_pumped = parse_gallons(record.gallons_pumped)
+        job.invoice_total_cents = parse_money(record.invoice_total)
+        job.service_date = parse_date(record.service_date)
         return job
 
-    @staticmethod
-    def _parse_gallons(value: str | None) -> float | None:
-        """Parse gallons string to float."""
-        if not value:
-            return None
-        val = value.lower().replace("gallons", "").replace("gal", "")
-        val = val.replace(",", "").strip()
-        try:
-            return float(val)
-        except ValueError:
-            return None
-
-    @staticmethod
-    def _parse_money(value: str | None) -> int | None:
-        """Parse money string to cents."""
-        if not value:
-            return None
-        val = value.replace("$", "").replace(",", "").strip()
-        try:
-            return int(float(val) * 100)
-        except ValueError:
-            return None
-
-    @staticmethod
-    def _parse_date(value: str | None) -> date | None:
-        """Parse date string to date object."""
-        if not value:
-            return None
-        # Try common formats
-        formats = ["%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y", "%B %d, %Y", "%b %d, %Y"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(value.strip(), fmt).date()
-            except ValueError:
-                continue
-        return None
-
     def can_verify(self) -> bool:
         """Check if job has all required fields filled to be verified."""
         required = [
@@ -450,9 +505,45 @@ class Job:
             missing.append("customer_name")
         return missing
 
+    def get_record_field_text(self, name: str) -> str:
+        """Get a service record field as editable text ("" when unset)."""
+        if name == "service_date":
+            return self.service_date_str or (
+                self.service_date.isoformat() if self.service_date is not None else ""
+            )
+        if name == "gallons_pumped":
+            return self.gallons_pumped_str or (
+                f"{self.gallons_pumped:,.0f}" if self.gallons_pumped is not None else ""
+            )
+        value = getattr(self, name)
+        return value if value is not None else ""
+
+    @property
+    def invoice_total(self) -> str | None:
+        """Invoice total as recorded text, else formatted from cents."""
+        if self.invoice_total_str:
+            return self.invoice_total_str
+        if self.invoice_total_cents is not None:
+            return f"${self.invoice_total_cents / 100:,.2f}"
+        return None
+
+    def set_record_field_text(self, name: str, value: str | None) -> None:
+        """Set a service record field from text, re-deriving typed values."""
+        if name == "service_date":
+            self.service_date_str = value
+            self.service_date = parse_date(value)
+        elif name == "gallons_pumped":
+            self.gallons_pumped_str = value
+            self.gallons_pumped = parse_gallons(value)
+        elif name == "invoice_total":
+            self.invoice_total_str = value
+            self.invoice_total_cents = parse_money(value)
+        else:
+            setattr(self, name, value)
+
     def get_record_dict(self) -> dict:
         """Get just the service record fields as a dict."""
-        return {name: getattr(self, name, None) for name in RECORD_FIELD_NAMES}
+        return dict(zip(RECORD_FIELD_NAMES, _get_record_values(self), strict=True))
 
     def get_gallons_display(self) -> str:
         """Get formatted gallons for display."""
@@ -478,7 +569,7 @@ class Job:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """
     A document or file attached to a job.
@@ -502,10 +593,11 @@ class Document:
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dictionary."""
-        d = asdict(self)
+        d = _shallow_dict(self)
         d["doc_id"] = str(self.doc_id)
         d["job_id"] = str(self.job_id) if self.job_id else None
         d["doc_type"] = self.doc_type.value
+        d["parsed_fields"] = dict(self.parsed_fields)
         d["created_at"] = self.created_at.isoformat()
         return d
 
@@ -515,7 +607,7 @@ class Document:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class JobPacket:
     """
     Tracks completeness of a job's document packet.
@@ -533,9 +625,12 @@ class JobPacket:
     @property
     def completeness_percentage(self) -> int:
         """Calculate packet completeness (invoice + manifest = 100%)."""
-        required = [self.has_invoice, self.has_manifest]
-        complete = sum(required)
-        return int((complete / len(required)) * 100)
+        complete = 0
+        if self.has_invoice:
+            complete += 1
+        if self.has_manifest:
+            complete += 1
+        return complete * 50
 
     @property
     def is_complete(self) -> bool:
@@ -555,12 +650,44 @@ class JobPacket:
         }
 
 
+# =============================================================================
+# LIST VIEW SUMMARIES
+# =============================================================================
+
+
+@dataclass(slots=True)
+class CustomerSummary:
+    """The columns a customer list row needs, without the full record."""
+
+    customer_id: str
+    name: str
+    phone: str | None = None
+    email: str | None = None
+    city: str | None = None
+
+
+@dataclass(slots=True)
+class JobSummary:
+    """The columns a job list row needs, without the full record."""
+
+    job_id: str
+    status: JobStatus
+    invoice_number: str | None = None
+    customer_name: str | None = None
+    service_date: str | None = None  # As stored: ISO date or raw text
+    invoice_total: str | None = None  # As stored: "$1,234.56" or raw text
+
+    def get_invoice_total_display(self) -> str:
+        """Get formatted invoice total for display."""
+        return self.invoice_total or "—"
+
+
 # =============================================================================
 # ANALYTICS / KPI TYPES
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class DashboardKPIs:
     """Container for dashboard KPI metrics."""
 
@@ -586,13 +713,13 @@ class DashboardKPIs:
         return self.avg_revenue_per_job_cents / 100
 
     def to_dict(self) -> dict:
-        d = asdict(self)
+        d = _shallow_dict(self)
         d["total_revenue"] = self.total_revenue
         d["avg_revenue_per_job"] = self.avg_revenue_per_job
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeSeriesPoint:
     """A single data point for time series charts."""
 
@@ -12,7 +12,9 @@ WHY THIS FILE EXISTS:
 """
 
 import re
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
+
+from .models import _field_names
 
 # All the fields we try to extract from an invoice
 EXPECTED_FIELDS = [
@@ -28,8 +30,52 @@ EXPECTED_FIELDS = [
     "invoice_total",
 ]
 
-
-@dataclass
+# Field patterns, compiled once at import.
+# Invoice number: "INVOICE #: XXX", "Invoice No: XXX", "Inv #XXX"
+_INVOICE_RE = re.compile(
+    r"(?:INVOICE|INV)(?:\s*(?:NO|#|\.)|:|\s)+[:\s]*([A-Z0-9\-]+)", re.IGNORECASE
+)
+# Service date: "Service Date: XXX", "DATE: XXX", dates like "January 8, 2026"
+_DATE_RE = re.compile(
+    r"(?:Service Date|DATE)[\s:]+"
+    r"([A-Za-z]+\s+\d{1,2},?\s+\d{4}|\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
+    re.IGNORECASE,
+)
+# Customer name: first non-empty line after "BILL TO:"
+_BILL_TO_RE = re.compile(r"BILL TO[:\s]*\n\s*(.+?)(?:\n|$)", re.IGNORECASE)
+# Address: number + street name + city/state/zip
+_ADDRESS_RE = re.compile(
+    r"(\d+\s+[\w \t\n]{1,80}?"
+    r"(?:Avenue|Ave|Street|St|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Parkway|Pkwy)"
+    r"[\s,]+[\w \t\n]{1,60},?\s*[A-Z]{2}\s*\d{5})",
+    re.IGNORECASE,
+)
+# Phone: (XXX) XXX-XXXX or XXX-XXX-XXXX
+_PHONE_RE = re.compile(r"\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}")
+# Trap size: "Trap Size: 1,500 gallons", "Trap Capacity: 1500 gal"
+_TRAP_SIZE_RE = re.compile(
+    r"(?:Trap Size|Trap Capacity)[\s:]+([0-9,]+\s*(?:gallons?|gal))", re.IGNORECASE
+)
+# Gallons pumped: "Gallons Pumped: 1,320", "pumped 1320 gallons"
+_GALLONS_RE = re.compile(
+    r"(?:Gallons? Pumped|Pumped)[\s:]+([0-9,]+)\s*(?:gallons?|gal)?", re.IGNORECASE
+)
+# Technician: "Technician: John Smith", "Tech: J. Smith"
+_TECHNICIAN_RE = re.compile(
+    r"(?:Technician|Tech)[\s:]+([A-Za-z\s.]+?)(?:\n|$|Truck)", re.IGNORECASE
+)
+# Disposal facility: "Disposal Facility: XXX", "Disposed at XXX"
+_DISPOSAL_RE = re.compile(
+    r"(?:Disposal (?:Facility|Site)|Disposed at)[\s:]+(.+?)(?:\n|$)", re.IGNORECASE
+)
+# Invoice total: "TOTAL: $XXX", "TOTAL DUE: $XXX", "Amount Due: $XXX"
+_TOTAL_RE = re.compile(
+    r"(?:TOTAL(?: DUE)?|Amount Due|Grand Total)[\s:]+\$?([\d,]+\.?\d*)",
+    re.IGNORECASE,
+)
+
+
+@dataclass(slots=True)
 class ServiceRecord:
     """
     A structured representation of a grease trap service invoice.
@@ -54,10 +100,11 @@ class ServiceRecord:
 
     def to_dict(self) -> dict:
         """Convert to a JSON-serializable dictionary."""
-        return asdict(self)
+        # Every field is a plain string, so no asdict() deepcopy is needed
+        return {name: getattr(self, name) for name in _field_names(type(self))}
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     """
     The full result of parsing an invoice.
@@ -111,30 +158,19 @@ def parse_text_to_record(text: str) -> ParseResult:
     extracted = []
 
     # --- INVOICE NUMBER ---
-    # Patterns: "INVOICE #: XXX", "Invoice No: XXX", "Inv #XXX"
-    invoice_match = re.search(
-        r"(?:INVOICE|INV)(?:\s*(?:NO|#|\.)|:|\s)+[:\s]*([A-Z0-9\-]+)",
-        text,
-        re.IGNORECASE,
-    )
+    invoice_match = _INVOICE_RE.search(text)
     if invoice_match:
         record.invoice_number = invoice_match.group(1).strip()
         extracted.append("invoice_number")
 
     # --- SERVICE DATE ---
-    # Patterns: "Service Date: XXX", "DATE: XXX", dates like "January 8, 2026"
-    date_pattern = (
-        r"(?:Service Date|DATE)[\s:]+"
-        r"([A-Za-z]+\s+\d{1,2},?\s+\d{4}|\d{1,2}[/-]\d{1,2}[/-]\d{2,4})"
-    )
-    date_match = re.search(date_pattern, text, re.IGNORECASE)
+    date_match = _DATE_RE.search(text)
     if date_match:
         record.service_date = date_match.group(1).strip()
         extracted.append("service_date")
 
     # --- CUSTOMER NAME ---
-    # Look for "BILL TO:" section, grab first non-empty line after
-    bill_to_match = re.search(r"BILL TO[:\s]*\n\s*(.+?)(?:\n|$)", text, re.IGNORECASE)
+    bill_to_match = _BILL_TO_RE.search(text)
     if bill_to_match:
         name = bill_to_match.group(1).strip()
         # Skip if it's "Attn:" line
@@ -143,72 +179,43 @@ def parse_text_to_record(text: str) -> ParseResult:
             extracted.append("customer_name")
 
     # --- CUSTOMER ADDRESS ---
-    # Look for address pattern (number + street name + city/state/zip)
-    address_match = re.search(
-        r"(\d+\s+[\w\s]+(?:Avenue|Ave|Street|St|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Parkway|Pkwy)[\s,]+[\w\s]+,?\s*[A-Z]{2}\s*\d{5})",
-        text,
-        re.IGNORECASE,
-    )
+    address_match = _ADDRESS_RE.search(text)
     if address_match:
         record.customer_address = address_match.group(1).strip()
         extracted.append("customer_address")
 
     # --- PHONE ---
-    # Pattern: (XXX) XXX-XXXX or XXX-XXX-XXXX
-    phone_match = re.search(r"\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}", text)
+    phone_match = _PHONE_RE.search(text)
     if phone_match:
         record.phone = phone_match.group(0).strip()
         extracted.append("phone")
 
     # --- TRAP SIZE ---
-    # Patterns: "Trap Size: 1,500 gallons", "1500 gal trap"
-    trap_match = re.search(
-        r"(?:Trap Size|Trap Capacity)[\s:]+([0-9,]+\s*(?:gallons?|gal))",
-        text,
-        re.IGNORECASE,
-    )
+    trap_match = _TRAP_SIZE_RE.search(text)
     if trap_match:
         record.trap_size = trap_match.group(1).strip()
         extracted.append("trap_size")
 
     # --- GALLONS PUMPED ---
-    # Patterns: "Gallons Pumped: 1,320", "pumped 1320 gallons"
-    gallons_match = re.search(
-        r"(?:Gallons? Pumped|Pumped)[\s:]+([0-9,]+)\s*(?:gallons?|gal)?",
-        text,
-        re.IGNORECASE,
-    )
+    gallons_match = _GALLONS_RE.search(text)
     if gallons_match:
         record.gallons_pumped = gallons_match.group(1).strip() + " gallons"
         extracted.append("gallons_pumped")
 
     # --- TECHNICIAN ---
-    # Patterns: "Technician: John Smith", "Tech: J. Smith"
-    tech_match = re.search(
-        r"(?:Technician|Tech)[\s:]+([A-Za-z\s.]+?)(?:\n|$|Truck)", text, re.IGNORECASE
-    )
+    tech_match = _TECHNICIAN_RE.search(text)
     if tech_match:
         record.technician = tech_match.group(1).strip()
         extracted.append("technician")
 
     # --- DISPOSAL FACILITY ---
-    # Patterns: "Disposal Facility: XXX", look for treatment/facility names
-    disposal_match = re.search(
-        r"(?:Disposal (?:Facility|Site)|Disposed at)[\s:]+(.+?)(?:\n|$)",
-        text,
-        re.IGNORECASE,
-    )
+    disposal_match = _DISPOSAL_RE.search(text)
     if disposal_match:
         record.disposal_facility = disposal_match.group(1).strip()
         extracted.append("disposal_facility")
 
     # --- INVOICE TOTAL ---
-    # Patterns: "TOTAL: $XXX", "TOTAL DUE: $XXX", "Amount Due: $XXX"
-    total_match = re.search(
-        r"(?:TOTAL(?: DUE)?|Amount Due|Grand Total)[\s:]+\$?([\d,]+\.?\d*)",
-        text,
-        re.IGNORECASE,
-    )
+    total_match = _TOTAL_RE.search(text)
     if total_match:
         record.invoice_total = "$" + total_match.group(1).strip()
         extracted.append("invoice_total")
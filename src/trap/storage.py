@@ -18,15 +18,21 @@ from pathlib import Path
 from uuid import UUID
 
 from .models import (
+    RECORD_FIELD_NAMES,
     Customer,
+    CustomerSummary,
     DashboardKPIs,
     Document,
     DocumentType,
     Job,
     JobStatus,
+    JobSummary,
     ServiceFrequency,
     Site,
     TimeSeriesPoint,
+    parse_date,
+    parse_gallons,
+    parse_money,
 )
 
 # Default database path
@@ -55,6 +61,10 @@ def get_connection(db_path: Path | None = None):
     conn.row_factory = sqlite3.Row
     # Enable foreign keys
     conn.execute("PRAGMA foreign_keys = ON")
+    # The database runs in WAL mode (set by init_db), where NORMAL sync is
+    # still crash-safe and skips an fsync per commit
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
     try:
         yield conn
         conn.commit()
@@ -62,6 +72,26 @@ def get_connection(db_path: Path | None = None):
         conn.close()
 
 
+def _upsert_sql(table: str, key: str, columns: str) -> str:
+    """
+    Build an INSERT that updates the existing row on a ``key`` conflict.
+
+    ``columns`` is the comma-separated column list, in parameter order.
+    Unlike INSERT OR REPLACE the row is updated in place rather than deleted
+    and re-inserted, so created_at and any column not listed keep their
+    stored values.
+    """
+    names = [col.strip() for col in columns.split(",")]
+    updates = ", ".join(
+        f"{col} = excluded.{col}" for col in names if col not in (key, "created_at")
+    )
+    return (
+        f"INSERT INTO {table} ({', '.join(names)}) "
+        f"VALUES ({', '.join('?' * len(names))}) "
+        f"ON CONFLICT({key}) DO UPDATE SET {updates}"
+    )
+
+
 # =============================================================================
 # DATABASE MIGRATIONS
 # =============================================================================
@@ -100,6 +130,31 @@ def _migrate_jobs_table(conn: sqlite3.Connection) -> None:
         if col_name not in existing_columns:
             conn.execute(f"ALTER TABLE jobs ADD COLUMN {col_name} {col_type}")
 
+    # Backfill the typed columns once for rows saved before save_job wrote them
+    if conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+        rows = conn.execute(
+            "SELECT job_id, service_date, gallons_pumped, invoice_total FROM jobs"
+        ).fetchall()
+        conn.executemany(
+            """
+            UPDATE jobs SET service_date_typed = ?, gallons_pumped_float = ?,
+                invoice_total_cents = ?
+            WHERE job_id = ?
+            """,
+            [
+                (
+                    service_date.isoformat()
+                    if (service_date := parse_date(row["service_date"]))
+                    else None,
+                    parse_gallons(row["gallons_pumped"]),
+                    parse_money(row["invoice_total"]),
+                    row["job_id"],
+                )
+                for row in rows
+            ],
+        )
+        conn.execute("PRAGMA user_version = 1")
+
 
 # =============================================================================
 # DATABASE INITIALIZATION
@@ -109,6 +164,10 @@ def _migrate_jobs_table(conn: sqlite3.Connection) -> None:
 def init_db(db_path: Path | None = None) -> None:
     """Initialize the database schema with all tables."""
     with get_connection(db_path) as conn:
+        # WAL lets dashboard reads run alongside writes; the mode is stored
+        # in the database file, so it only needs setting here
+        conn.execute("PRAGMA journal_mode = WAL")
+
         # Customers table
         conn.execute("""
             CREATE TABLE IF NOT EXISTS customers (
@@ -228,6 +287,10 @@ def init_db(db_path: Path | None = None) -> None:
         conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_jobs_service_date ON jobs(service_date)"
         )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_service_date_typed "
+            "ON jobs(service_date_typed)"
+        )
         conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at DESC)"
         )
@@ -237,8 +300,9 @@ def init_db(db_path: Path | None = None) -> None:
 def reset_db(db_path: Path | None = None) -> None:
     """Drop and recreate all tables. WARNING: Destroys all data."""
     path = db_path or get_db_path()
-    if path.exists():
-        path.unlink()
+    # Drop the WAL sidecar files too so no stale pages outlive the database
+    for suffix in ("", "-wal", "-shm"):
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
     init_db(db_path)
 
 
@@ -267,19 +331,24 @@ def _row_to_customer(row: sqlite3.Row) -> Customer:
     )
 
 
+_CUSTOMER_UPSERT_SQL = _upsert_sql(
+    "customers",
+    "customer_id",
+    """
+        customer_id, name, legal_name, phone, email,
+        billing_address, service_address, city, state, zip_code,
+        notes, is_active, created_at, updated_at
+    """,
+)
+
+
 def save_customer(customer: Customer, db_path: Path | None = None) -> Customer:
     """Save a customer (insert or update)."""
     customer.updated_at = datetime.now()
 
     with get_connection(db_path) as conn:
         conn.execute(
-            """
-            INSERT OR REPLACE INTO customers (
-                customer_id, name, legal_name, phone, email,
-                billing_address, service_address, city, state, zip_code,
-                notes, is_active, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _CUSTOMER_UPSERT_SQL,
             (
                 str(customer.customer_id),
                 customer.name,
@@ -313,6 +382,22 @@ def get_customer(
     return None
 
 
+def _customer_filters(search: str | None, active_only: bool) -> tuple[str, list]:
+    """Build the WHERE clause shared by the customer list queries."""
+    where = "WHERE 1=1"
+    params: list = []
+
+    if active_only:
+        where += " AND is_active = 1"
+
+    if search:
+        where += " AND (name LIKE ? OR legal_name LIKE ? OR email LIKE ?)"
+        pattern = f"%{search}%"
+        params.extend([pattern, pattern, pattern])
+
+    return where, params
+
+
 def list_customers(
     search: str | None = None,
     active_only: bool = True,
@@ -321,23 +406,33 @@ def list_customers(
     db_path: Path | None = None,
 ) -> list[Customer]:
     """List customers with optional filtering."""
+    where, params = _customer_filters(search, active_only)
     with get_connection(db_path) as conn:
-        query = "SELECT * FROM customers WHERE 1=1"
-        params: list = []
-
-        if active_only:
-            query += " AND is_active = 1"
-
-        if search:
-            query += " AND (name LIKE ? OR legal_name LIKE ? OR email LIKE ?)"
-            pattern = f"%{search}%"
-            params.extend([pattern, pattern, pattern])
+        rows = conn.execute(
+            f"SELECT * FROM customers {where} ORDER BY name ASC LIMIT ? OFFSET ?",
+            [*params, limit, offset],
+        ).fetchall()
+        return [_row_to_customer(row) for row in rows]
 
-        query += " ORDER BY name ASC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
 
-        rows = conn.execute(query, params).fetchall()
-        return [_row_to_customer(row) for row in rows]
+def list_customers_summary(
+    search: str | None = None,
+    active_only: bool = True,
+    limit: int = 100,
+    offset: int = 0,
+    db_path: Path | None = None,
+) -> list[CustomerSummary]:
+    """List customers for display, selecting only the list view columns."""
+    where, params = _customer_filters(search, active_only)
+    with get_connection(db_path) as conn:
+        rows = conn.execute(
+            f"""
+            SELECT customer_id, name, phone, email, city FROM customers {where}
+            ORDER BY name ASC LIMIT ? OFFSET ?
+            """,
+            [*params, limit, offset],
+        ).fetchall()
+        return [CustomerSummary(*row) for row in rows]
 
 
 def update_customer(
@@ -434,21 +529,26 @@ def _row_to_site(row: sqlite3.Row) -> Site:
     )
 
 
+_SITE_UPSERT_SQL = _upsert_sql(
+    "sites",
+    "site_id",
+    """
+        site_id, customer_id, name, address, city, state, zip_code,
+        municipality, sewer_authority, permit_number,
+        service_frequency, service_frequency_days,
+        last_service_date, next_service_date,
+        access_notes, notes, is_active, created_at, updated_at
+    """,
+)
+
+
 def save_site(site: Site, db_path: Path | None = None) -> Site:
     """Save a site (insert or update)."""
     site.updated_at = datetime.now()
 
     with get_connection(db_path) as conn:
         conn.execute(
-            """
-            INSERT OR REPLACE INTO sites (
-                site_id, customer_id, name, address, city, state, zip_code,
-                municipality, sewer_authority, permit_number,
-                service_frequency, service_frequency_days,
-                last_service_date, next_service_date,
-                access_notes, notes, is_active, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _SITE_UPSERT_SQL,
             (
                 str(site.site_id),
                 str(site.customer_id) if site.customer_id else None,
@@ -547,15 +647,6 @@ def count_sites(active_only: bool = True, db_path: Path | None = None) -> int:
 
 def _row_to_job(row: sqlite3.Row) -> Job:
     """Convert a database row to a Job object."""
-    from datetime import date as date_type
-
-    # Helper to safely get column (for migration compatibility)
-    def safe_get(col: str):
-        try:
-            return row[col]
-        except (IndexError, KeyError):
-            return None
-
     # Parse scheduled_date as date
     scheduled = None
     if row["scheduled_date"]:
@@ -573,26 +664,24 @@ def _row_to_job(row: sqlite3.Row) -> Job:
             # Keep as string in service_date_str
             pass
 
-    # Parse gallons
-    gallons_str = row["gallons_pumped"]
-    gallons_float = None
-    if gallons_str:
+    # Helper to safely get column (for migration compatibility)
+    def safe_get(col: str):
         try:
-            val = gallons_str.lower().replace("gallons", "").replace("gal", "")
-            val = val.replace(",", "").strip()
-            gallons_float = float(val)
-        except (ValueError, AttributeError):
-            pass
+            return row[col]
+        except (IndexError, KeyError):
+            return None
+
+    # Typed gallons/total are stored by save_job; parse the display text only
+    # for rows written without them
+    gallons_str = row["gallons_pumped"]
+    gallons_float = safe_get("gallons_pumped_float")
+    if gallons_float is None:
+        gallons_float = parse_gallons(gallons_str)
 
-    # Parse invoice total
     invoice_str = row["invoice_total"]
-    invoice_cents = None
-    if invoice_str:
-        try:
-            val = invoice_str.replace("$", "").replace(",", "").strip()
-            invoice_cents = int(float(val) * 100)
-        except (ValueError, AttributeError):
-            pass
+    invoice_cents = safe_get("invoice_total_cents")
+    if invoice_cents is None:
+        invoice_cents = parse_money(invoice_str)
 
     return Job(
         job_id=UUID(row["job_id"]),
@@ -630,42 +719,55 @@ def _row_to_job(row: sqlite3.Row) -> Job:
     )
 
 
+_JOB_UPSERT_SQL = _upsert_sql(
+    "jobs",
+    "job_id",
+    """
+        job_id, customer_id, site_id, created_at, updated_at,
+        scheduled_date, source_filename, confidence_score,
+        extracted_fields, missing_fields, status,
+        invoice_number, manifest_number, service_date, customer_name,
+        customer_address, phone, trap_size, gallons_pumped,
+        technician, truck_id, disposal_facility, invoice_total, notes,
+        service_date_typed, gallons_pumped_float, invoice_total_cents
+    """,
+)
+
+
 def save_job(job: Job, db_path: Path | None = None) -> Job:
     """Save a job (insert or update)."""
     job.updated_at = datetime.now()
 
     # Convert typed values to strings for database storage
     # Prefer typed value, fall back to string value
+    # Typed values also go to their own columns (string-only jobs are parsed
+    # here) so analytics can aggregate without re-parsing the text
     service_date_db = None
+    service_date_typed = job.service_date or parse_date(job.service_date_str)
     if job.service_date:
         service_date_db = job.service_date.isoformat()
     elif job.service_date_str:
         service_date_db = job.service_date_str
 
     gallons_db = None
+    gallons_float = job.gallons_pumped
     if job.gallons_pumped is not None:
         gallons_db = f"{job.gallons_pumped:,.0f} gallons"
     elif job.gallons_pumped_str:
         gallons_db = job.gallons_pumped_str
+        gallons_float = parse_gallons(job.gallons_pumped_str)
 
     invoice_db = None
+    invoice_cents = job.invoice_total_cents
     if job.invoice_total_cents is not None:
         invoice_db = f"${job.invoice_total_cents / 100:,.2f}"
     elif job.invoice_total_str:
         invoice_db = job.invoice_total_str
+        invoice_cents = parse_money(job.invoice_total_str)
 
     with get_connection(db_path) as conn:
         conn.execute(
-            """
-            INSERT OR REPLACE INTO jobs (
-                job_id, customer_id, site_id, created_at, updated_at,
-                scheduled_date, source_filename, confidence_score,
-                extracted_fields, missing_fields, status,
-                invoice_number, manifest_number, service_date, customer_name,
-                customer_address, phone, trap_size, gallons_pumped,
-                technician, truck_id, disposal_facility, invoice_total, notes
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _JOB_UPSERT_SQL,
             (
                 str(job.job_id),
                 str(job.customer_id) if job.customer_id else None,
@@ -691,6 +793,9 @@ def save_job(job: Job, db_path: Path | None = None) -> Job:
                 job.disposal_facility,
                 invoice_db,
                 job.notes,
+                service_date_typed.isoformat() if service_date_typed else None,
+                gallons_float,
+                invoice_cents,
             ),
         )
     return job
@@ -707,6 +812,46 @@ def load_job(job_id: UUID | str, db_path: Path | None = None) -> Job | None:
     return None
 
 
+def _job_filters(
+    status: JobStatus | None,
+    customer_id: UUID | str | None,
+    technician: str | None,
+    search: str | None,
+    date_from: str | None,
+    date_to: str | None,
+) -> tuple[str, list]:
+    """Build the WHERE clause shared by the job list queries."""
+    where = "WHERE 1=1"
+    params: list = []
+
+    if status:
+        where += " AND status = ?"
+        params.append(status.value)
+
+    if customer_id:
+        where += " AND customer_id = ?"
+        params.append(str(customer_id))
+
+    if technician:
+        where += " AND technician LIKE ?"
+        params.append(f"%{technician}%")
+
+    if search:
+        where += " AND (customer_name LIKE ? OR invoice_number LIKE ?)"
+        pattern = f"%{search}%"
+        params.extend([pattern, pattern])
+
+    if date_from:
+        where += " AND service_date_typed >= ?"
+        params.append(date_from)
+
+    if date_to:
+        where += " AND service_date_typed <= ?"
+        params.append(date_to)
+
+    return where, params
+
+
 def list_jobs(
     status: JobStatus | None = None,
     customer_id: UUID | str | None = None,
@@ -719,52 +864,73 @@ def list_jobs(
     db_path: Path | None = None,
 ) -> list[Job]:
     """List jobs with optional filtering."""
+    where, params = _job_filters(
+        status, customer_id, technician, search, date_from, date_to
+    )
     with get_connection(db_path) as conn:
-        query = "SELECT * FROM jobs WHERE 1=1"
-        params: list = []
-
-        if status:
-            query += " AND status = ?"
-            params.append(status.value)
-
-        if customer_id:
-            query += " AND customer_id = ?"
-            params.append(str(customer_id))
-
-        if technician:
-            query += " AND technician LIKE ?"
-            params.append(f"%{technician}%")
-
-        if search:
-            query += " AND (customer_name LIKE ? OR invoice_number LIKE ?)"
-            pattern = f"%{search}%"
-            params.extend([pattern, pattern])
-
-        if date_from:
-            query += " AND service_date >= ?"
-            params.append(date_from)
+        rows = conn.execute(
+            f"SELECT * FROM jobs {where} ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            [*params, limit, offset],
+        ).fetchall()
+        return [_row_to_job(row) for row in rows]
 
-        if date_to:
-            query += " AND service_date <= ?"
-            params.append(date_to)
 
-        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
-
-        rows = conn.execute(query, params).fetchall()
-        return [_row_to_job(row) for row in rows]
+def list_jobs_summary(
+    status: JobStatus | None = None,
+    customer_id: UUID | str | None = None,
+    technician: str | None = None,
+    search: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    limit: int = 100,
+    offset: int = 0,
+    db_path: Path | None = None,
+) -> list[JobSummary]:
+    """List jobs for display, selecting only the list view columns."""
+    where, params = _job_filters(
+        status, customer_id, technician, search, date_from, date_to
+    )
+    with get_connection(db_path) as conn:
+        rows = conn.execute(
+            f"""
+            SELECT job_id, status, invoice_number, customer_name, service_date,
+                   invoice_total
+            FROM jobs {where}
+            ORDER BY created_at DESC LIMIT ? OFFSET ?
+            """,
+            [*params, limit, offset],
+        ).fetchall()
+        return [
+            JobSummary(
+                job_id=row["job_id"],
+                status=JobStatus(row["status"]),
+                invoice_number=row["invoice_number"],
+                customer_name=row["customer_name"],
+                service_date=row["service_date"],
+                invoice_total=row["invoice_total"],
+            )
+            for row in rows
+        ]
 
 
 def update_job(
     job_id: UUID | str, updates: dict, db_path: Path | None = None
 ) -> Job | None:
-    """Update specific fields on a job."""
+    """
+    Update specific fields on a job.
+
+    Service record fields given as text (e.g. "invoice_total": "$1,250.00")
+    are set through Job.set_record_field_text so their typed values are
+    re-derived.
+    """
     job = load_job(job_id, db_path)
     if not job:
         return None
 
     for key, value in updates.items():
-        if hasattr(job, key):
+        if key in RECORD_FIELD_NAMES and (value is None or isinstance(value, str)):
+            job.set_record_field_text(key, value)
+        elif hasattr(job, key):
             if key == "status" and isinstance(value, str):
                 value = JobStatus(value)
             setattr(job, key, value)
@@ -795,11 +961,11 @@ def count_jobs(
             params.append(status.value)
 
         if date_from:
-            query += " AND service_date >= ?"
+            query += " AND service_date_typed >= ?"
             params.append(date_from)
 
         if date_to:
-            query += " AND service_date <= ?"
+            query += " AND service_date_typed <= ?"
             params.append(date_to)
 
         row = conn.execute(query, params).fetchone()
@@ -948,6 +1114,9 @@ def delete_document(doc_id: UUID | str, db_path: Path | None = None) -> bool:
 # ANALYTICS / KPI QUERIES
 # =============================================================================
 
+# Aggregates read the typed columns save_job stores next to the display text
+# ("$1,234.56", "1,200 gallons"), so no string parsing happens in queries.
+
 
 def get_dashboard_kpis(
     date_from: str | None = None,
@@ -965,10 +1134,10 @@ def get_dashboard_kpis(
         params: list = []
 
         if date_from:
-            where += " AND service_date >= ?"
+            where += " AND service_date_typed >= ?"
             params.append(date_from)
         if date_to:
-            where += " AND service_date <= ?"
+            where += " AND service_date_typed <= ?"
             params.append(date_to)
         if customer_id:
             where += " AND customer_id = ?"
@@ -977,100 +1146,56 @@ def get_dashboard_kpis(
             where += " AND technician LIKE ?"
             params.append(f"%{technician}%")
 
-        # Jobs completed
-        row = conn.execute(
-            f"SELECT COUNT(*) FROM jobs {where} AND status IN ('Completed', 'Verified', 'Invoiced', 'Exported')",
-            params,
-        ).fetchone()
-        kpis.jobs_completed = row[0] if row else 0
-
-        # Jobs scheduled
-        row = conn.execute(
-            f"SELECT COUNT(*) FROM jobs {where} AND status = 'Scheduled'", params
-        ).fetchone()
-        kpis.jobs_scheduled = row[0] if row else 0
-
-        # Jobs in progress
-        row = conn.execute(
-            f"SELECT COUNT(*) FROM jobs {where} AND status = 'In Progress'", params
-        ).fetchone()
-        kpis.jobs_in_progress = row[0] if row else 0
-
-        # Revenue and gallons (need to parse string values)
-        rows = conn.execute(
-            f"SELECT invoice_total, gallons_pumped FROM jobs {where}", params
-        ).fetchall()
-
-        total_revenue = 0.0
-        total_gallons = 0.0
-        job_count = 0
-
-        for row in rows:
-            job_count += 1
-            # Parse invoice_total
-            if row["invoice_total"]:
-                val = row["invoice_total"].replace("$", "").replace(",", "").strip()
-                try:
-                    total_revenue += float(val)
-                except ValueError:
-                    pass
-            # Parse gallons_pumped
-            if row["gallons_pumped"]:
-                val = (
-                    row["gallons_pumped"]
-                    .lower()
-                    .replace("gallons", "")
-                    .replace("gal", "")
-                    .replace(",", "")
-                    .strip()
-                )
-                try:
-                    total_gallons += float(val)
-                except ValueError:
-                    pass
-
-        kpis.total_revenue_cents = int(total_revenue * 100)
-        kpis.total_gallons = total_gallons
-
-        if job_count > 0:
-            kpis.avg_revenue_per_job_cents = int((total_revenue / job_count) * 100)
-            kpis.avg_gallons_per_job = total_gallons / job_count
-
-        # Docs missing (jobs without invoice or manifest document)
+        # Every KPI in one round-trip: aggregates over the filtered jobs plus
+        # the unfiltered overdue/customer/site totals as scalar subqueries.
+        now = datetime.now().isoformat()
         row = conn.execute(
             f"""
-            SELECT COUNT(*) FROM jobs j {where}
-            AND NOT EXISTS (
-                SELECT 1 FROM documents d
-                WHERE d.job_id = j.job_id
-                AND d.doc_type IN ('invoice', 'manifest')
-            )
+            WITH filtered AS (SELECT * FROM jobs {where})
+            SELECT
+                COUNT(*) AS job_count,
+                SUM(CASE WHEN j.status IN ('Completed', 'Verified', 'Invoiced',
+                    'Exported') THEN 1 ELSE 0 END) AS jobs_completed,
+                SUM(CASE WHEN j.status = 'Scheduled' THEN 1 ELSE 0 END)
+                    AS jobs_scheduled,
+                SUM(CASE WHEN j.status = 'In Progress' THEN 1 ELSE 0 END)
+                    AS jobs_in_progress,
+                COALESCE(SUM(j.invoice_total_cents), 0) AS total_revenue_cents,
+                TOTAL(j.gallons_pumped_float) AS total_gallons,
+                SUM(CASE WHEN NOT EXISTS (
+                    SELECT 1 FROM documents d
+                    WHERE d.job_id = j.job_id
+                    AND d.doc_type IN ('invoice', 'manifest')
+                ) THEN 1 ELSE 0 END) AS docs_missing_count,
+                (SELECT COUNT(*) FROM sites
+                 WHERE is_active = 1
+                   AND next_service_date IS NOT NULL
+                   AND next_service_date < ?) AS overdue_services,
+                (SELECT COUNT(*) FROM customers WHERE is_active = 1)
+                    AS customer_count,
+                (SELECT COUNT(*) FROM sites WHERE is_active = 1) AS site_count
+            FROM filtered j
             """,
-            params,
+            [*params, now],
         ).fetchone()
-        kpis.docs_missing_count = row[0] if row else 0
 
-        # Overdue services
-        now = datetime.now().isoformat()
-        row = conn.execute(
-            """
-            SELECT COUNT(*) FROM sites
-            WHERE is_active = 1
-              AND next_service_date IS NOT NULL
-              AND next_service_date < ?
-            """,
-            (now,),
-        ).fetchone()
-        kpis.overdue_services = row[0] if row else 0
+    job_count = row["job_count"]
+    total_revenue_cents = row["total_revenue_cents"]
+    total_gallons = row["total_gallons"]
 
-        # Customer and site counts
-        row = conn.execute(
-            "SELECT COUNT(*) FROM customers WHERE is_active = 1"
-        ).fetchone()
-        kpis.customer_count = row[0] if row else 0
+    kpis.jobs_completed = row["jobs_completed"] or 0
+    kpis.jobs_scheduled = row["jobs_scheduled"] or 0
+    kpis.jobs_in_progress = row["jobs_in_progress"] or 0
+    kpis.docs_missing_count = row["docs_missing_count"] or 0
+    kpis.overdue_services = row["overdue_services"]
+    kpis.customer_count = row["customer_count"]
+    kpis.site_count = row["site_count"]
+    kpis.total_revenue_cents = total_revenue_cents
+    kpis.total_gallons = total_gallons
 
-        row = conn.execute("SELECT COUNT(*) FROM sites WHERE is_active = 1").fetchone()
-        kpis.site_count = row[0] if row else 0
+    if job_count > 0:
+        kpis.avg_revenue_per_job_cents = int(total_revenue_cents / job_count)
+        kpis.avg_gallons_per_job = total_gallons / job_count
 
     return kpis
 
@@ -1084,17 +1209,17 @@ def get_jobs_by_date(
     """Get job counts grouped by date."""
     with get_connection(db_path) as conn:
         if group_by == "month":
-            date_expr = "substr(service_date, 1, 7)"  # YYYY-MM
+            date_expr = "substr(service_date_typed, 1, 7)"  # YYYY-MM
         elif group_by == "week":
-            date_expr = "strftime('%Y-W%W', service_date)"
+            date_expr = "strftime('%Y-W%W', service_date_typed)"
         else:
-            date_expr = "substr(service_date, 1, 10)"  # YYYY-MM-DD
+            date_expr = "service_date_typed"  # YYYY-MM-DD
 
         rows = conn.execute(
             f"""
             SELECT {date_expr} as period, COUNT(*) as count
             FROM jobs
-            WHERE service_date >= ? AND service_date <= ?
+            WHERE service_date_typed >= ? AND service_date_typed <= ?
             GROUP BY period
             ORDER BY period
             """,
@@ -1113,39 +1238,24 @@ def get_revenue_by_date(
     """Get revenue totals grouped by date."""
     with get_connection(db_path) as conn:
         if group_by == "month":
-            date_expr = "substr(service_date, 1, 7)"
+            date_expr = "substr(service_date_typed, 1, 7)"
         elif group_by == "week":
-            date_expr = "strftime('%Y-W%W', service_date)"
+            date_expr = "strftime('%Y-W%W', service_date_typed)"
         else:
-            date_expr = "substr(service_date, 1, 10)"
+            date_expr = "service_date_typed"
 
         rows = conn.execute(
             f"""
-            SELECT {date_expr} as period, invoice_total
+            SELECT {date_expr} as period, TOTAL(invoice_total_cents / 100.0) as total
             FROM jobs
-            WHERE service_date >= ? AND service_date <= ?
+            WHERE service_date_typed >= ? AND service_date_typed <= ?
+            GROUP BY period
             ORDER BY period
             """,
             (date_from, date_to),
         ).fetchall()
 
-        # Aggregate by period
-        aggregates: dict[str, float] = {}
-        for row in rows:
-            period = row["period"]
-            if period not in aggregates:
-                aggregates[period] = 0.0
-            if row["invoice_total"]:
-                val = row["invoice_total"].replace("$", "").replace(",", "").strip()
-                try:
-                    aggregates[period] += float(val)
-                except ValueError:
-                    pass
-
-        return [
-            TimeSeriesPoint(date=period, value=value)
-            for period, value in sorted(aggregates.items())
-        ]
+        return [TimeSeriesPoint(date=row["period"], value=row["total"]) for row in rows]
 
 
 def get_gallons_by_date(
@@ -1157,46 +1267,24 @@ def get_gallons_by_date(
     """Get gallons pumped totals grouped by date."""
     with get_connection(db_path) as conn:
         if group_by == "month":
-            date_expr = "substr(service_date, 1, 7)"
+            date_expr = "substr(service_date_typed, 1, 7)"
         elif group_by == "week":
-            date_expr = "strftime('%Y-W%W', service_date)"
+            date_expr = "strftime('%Y-W%W', service_date_typed)"
         else:
-            date_expr = "substr(service_date, 1, 10)"
+            date_expr = "service_date_typed"
 
         rows = conn.execute(
             f"""
-            SELECT {date_expr} as period, gallons_pumped
+            SELECT {date_expr} as period, TOTAL(gallons_pumped_float) as total
             FROM jobs
-            WHERE service_date >= ? AND service_date <= ?
+            WHERE service_date_typed >= ? AND service_date_typed <= ?
+            GROUP BY period
             ORDER BY period
             """,
             (date_from, date_to),
         ).fetchall()
 
-        # Aggregate by period
-        aggregates: dict[str, float] = {}
-        for row in rows:
-            period = row["period"]
-            if period not in aggregates:
-                aggregates[period] = 0.0
-            if row["gallons_pumped"]:
-                val = (
-                    row["gallons_pumped"]
-                    .lower()
-                    .replace("gallons", "")
-                    .replace("gal", "")
-                    .replace(",", "")
-                    .strip()
-                )
-                try:
-                    aggregates[period] += float(val)
-                except ValueError:
-                    pass
-
-        return [
-            TimeSeriesPoint(date=period, value=value)
-            for period, value in sorted(aggregates.items())
-        ]
+        return [TimeSeriesPoint(date=row["period"], value=row["total"]) for row in rows]
 
 
 def get_jobs_by_status(
@@ -1210,10 +1298,10 @@ def get_jobs_by_status(
         params: list = []
 
         if date_from:
-            where += " AND service_date >= ?"
+            where += " AND service_date_typed >= ?"
             params.append(date_from)
         if date_to:
-            where += " AND service_date <= ?"
+            where += " AND service_date_typed <= ?"
             params.append(date_to)
 
         rows = conn.execute(
@@ -1239,10 +1327,10 @@ def get_jobs_by_technician(
         params: list = []
 
         if date_from:
-            where += " AND service_date >= ?"
+            where += " AND service_date_typed >= ?"
             params.append(date_from)
         if date_to:
-            where += " AND service_date <= ?"
+            where += " AND service_date_typed <= ?"
             params.append(date_to)
 
         rows = conn.execute(
@@ -1270,33 +1358,22 @@ def get_top_customers_by_revenue(
         params: list = []
 
         if date_from:
-            where += " AND service_date >= ?"
+            where += " AND service_date_typed >= ?"
             params.append(date_from)
         if date_to:
-            where += " AND service_date <= ?"
+            where += " AND service_date_typed <= ?"
             params.append(date_to)
 
+        params.append(limit)
         rows = conn.execute(
             f"""
-            SELECT customer_name, invoice_total
+            SELECT customer_name, TOTAL(invoice_total_cents / 100.0) AS revenue
             FROM jobs {where}
+            GROUP BY customer_name
+            ORDER BY revenue DESC, customer_name
+            LIMIT ?
             """,
             params,
         ).fetchall()
 
-        # Aggregate by customer
-        aggregates: dict[str, float] = {}
-        for row in rows:
-            name = row["customer_name"]
-            if name not in aggregates:
-                aggregates[name] = 0.0
-            if row["invoice_total"]:
-                val = row["invoice_total"].replace("$", "").replace(",", "").strip()
-                try:
-                    aggregates[name] += float(val)
-                except ValueError:
-                    pass
-
-        # Sort and limit
-        sorted_customers = sorted(aggregates.items(), key=lambda x: x[1], reverse=True)
-        return sorted_customers[:limit]
+        return [(row["customer_name"], row["revenue"]) for row in rows]
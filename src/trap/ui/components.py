@@ -6,6 +6,52 @@ from datetime import datetime, timedelta
 
 import streamlit as st
 
+from ..models import parse_money
+
+# HTML templates, built once at import and filled with str.format per render
+KPI_CARD_HTML = (
+    '<div class="kpi-card">'
+    '<div class="kpi-value {color_class}">{value}</div>'
+    '<div class="kpi-label">{label}</div>'
+    "</div>"
+)
+
+KPI_GRID_HTML = (
+    '<div class="kpi-grid" style="grid-template-columns: repeat({columns}, 1fr);">'
+    "{cards}</div>"
+)
+
+# Look-back window in days for each date range preset ("Year to Date" is
+# computed from Jan 1; unknown presets fall back to 30 days)
+DATE_PRESET_DAYS = {
+    "Last 7 Days": 7,
+    "Last 30 Days": 30,
+    "Last 90 Days": 90,
+}
+
+# CSS class for each job status badge
+STATUS_CLASSES = {
+    "Scheduled": "status-scheduled",
+    "In Progress": "status-in-progress",
+    "Completed": "status-completed",
+    "Verified": "status-verified",
+    "Invoiced": "status-invoiced",
+    "Draft": "status-draft",
+    "Exported": "status-verified",
+    "Needs Docs": "status-needs-docs",
+}
+
+STATUS_BADGE_HTML = '<span class="status-badge {status_class}">{status}</span>'
+
+COMPLETENESS_BAR_HTML = (
+    '<div class="completeness-bar">'
+    '<div class="completeness-fill {fill_class}" style="width: {percentage}%"></div>'
+    "</div>"
+)
+
+PAGE_HEADER_HTML = '<h1 class="page-header">{title}</h1>'
+PAGE_SUBTITLE_HTML = '<p class="page-subtitle">{subtitle}</p>'
+
 
 def format_currency(cents: int | None) -> str:
     """Format cents as currency string."""
@@ -14,15 +60,9 @@ def format_currency(cents: int | None) -> str:
     return f"${cents / 100:,.2f}"
 
 
-def format_currency_input(value: str | None) -> int:
-    """Parse currency input string to cents."""
-    if not value:
-        return 0
-    cleaned = value.replace("$", "").replace(",", "").strip()
-    try:
-        return int(float(cleaned) * 100)
-    except ValueError:
-        return 0
+def format_currency_input(value: str | None) -> int | None:
+    """Parse currency input string to cents, or None if it is not an amount."""
+    return parse_money(value)
 
 
 def format_number(value: float | int | None) -> str:
@@ -56,52 +96,48 @@ def format_date(date_val: datetime | str | None) -> str:
 def get_date_range(preset: str) -> tuple[str, str]:
     """Get date range from preset."""
     today = datetime.now()
-    if preset == "Last 7 Days":
-        start = today - timedelta(days=7)
-    elif preset == "Last 30 Days":
-        start = today - timedelta(days=30)
-    elif preset == "Last 90 Days":
-        start = today - timedelta(days=90)
-    elif preset == "Year to Date":
+    if preset == "Year to Date":
         start = datetime(today.year, 1, 1)
     else:
-        start = today - timedelta(days=30)
+        start = today - timedelta(days=DATE_PRESET_DAYS.get(preset, 30))
     return start.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
 
 
 def get_status_class(status: str) -> str:
     """Get CSS class for status badge."""
-    status_map = {
-        "Scheduled": "scheduled",
-        "In Progress": "in-progress",
-        "Completed": "completed",
-        "Verified": "verified",
-        "Invoiced": "invoiced",
-        "Draft": "draft",
-        "Exported": "verified",
-        "Needs Docs": "needs-docs",
-    }
-    return f"status-{status_map.get(status, 'draft')}"
+    return STATUS_CLASSES.get(status, "status-draft")
 
 
 def kpi_card(value: str, label: str, color_class: str = "") -> None:
     """Render a KPI card."""
     st.markdown(
-        f"""
-        <div class="kpi-card">
-            <div class="kpi-value {color_class}">{value}</div>
-            <div class="kpi-label">{label}</div>
-        </div>
-        """,
+        KPI_CARD_HTML.format(value=value, label=label, color_class=color_class),
+        unsafe_allow_html=True,
+    )
+
+
+def kpi_grid(cards: list[tuple[str, str, str]], columns: int | None = None) -> None:
+    """
+    Render a row of KPI cards with a single markdown call.
+
+    Each card is a (value, label, color_class) tuple. Emitting one HTML grid
+    instead of one st.markdown per st.columns cell sends a single delta to
+    the frontend per row.
+    """
+    html = "".join(
+        KPI_CARD_HTML.format(value=value, label=label, color_class=color_class)
+        for value, label, color_class in cards
+    )
+    st.markdown(
+        KPI_GRID_HTML.format(columns=columns or len(cards), cards=html),
         unsafe_allow_html=True,
     )
 
 
 def status_badge(status: str) -> None:
     """Render a status badge."""
-    status_class = get_status_class(status)
     st.markdown(
-        f'<span class="status-badge {status_class}">{status}</span>',
+        STATUS_BADGE_HTML.format(status_class=get_status_class(status), status=status),
         unsafe_allow_html=True,
     )
 
@@ -118,21 +154,17 @@ def completeness_bar(percentage: int) -> None:
         fill_class = "completeness-25"
 
     st.markdown(
-        f"""
-        <div class="completeness-bar">
-            <div class="completeness-fill {fill_class}" style="width: {percentage}%"></div>
-        </div>
-        """,
+        COMPLETENESS_BAR_HTML.format(fill_class=fill_class, percentage=percentage),
         unsafe_allow_html=True,
     )
 
 
 def page_header(title: str, subtitle: str | None = None) -> None:
     """Render a page header with optional subtitle."""
-    st.markdown(f'<h1 class="page-header">{title}</h1>', unsafe_allow_html=True)
+    st.markdown(PAGE_HEADER_HTML.format(title=title), unsafe_allow_html=True)
     if subtitle:
         st.markdown(
-            f'<p class="page-subtitle">{subtitle}</p>', unsafe_allow_html=True
+            PAGE_SUBTITLE_HTML.format(subtitle=subtitle), unsafe_allow_html=True
         )
 
 
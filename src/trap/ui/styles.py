@@ -75,6 +75,12 @@ STYLES = """
         letter-spacing: 0.05em;
     }
 
+    .kpi-grid {
+        display: grid;
+        gap: 1rem;
+        margin-bottom: 1rem;
+    }
+
     .kpi-success { color: var(--success); }
     .kpi-warning { color: var(--warning); }
     .kpi-danger { color: var(--danger); }
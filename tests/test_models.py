@@ -0,0 +1,174 @@
+"""
+Tests for the domain models and their value parsers.
+
+These run without a database.
+"""
+
+from uuid import uuid4
+
+from trap.models import (
+    RECORD_FIELD_NAMES,
+    Job,
+    JobPacket,
+    JobStatus,
+    parse_date,
+    parse_gallons,
+    parse_money,
+)
+
+
+class TestValueParsing:
+    def test_parse_money(self):
+        """Money parsing is exact and rejects non-amount text."""
+        assert parse_money("19.99") == 1999
+        assert parse_money("$1,234.56") == 123456
+        assert parse_money("-$3.25") == -325
+        assert parse_money("$45") == 4500
+        assert parse_money("TOTAL: $5") is None
+        assert parse_money("$1,250.") == 125000
+        assert parse_money(".50") == 50
+        assert parse_money("$.") is None
+        assert parse_money("") is None
+
+    def test_parse_gallons(self):
+        """Gallons parsing drops unit words and separators."""
+        assert parse_gallons("1,200 Gallons") == 1200.0
+        assert parse_gallons("750.5 GAL") == 750.5
+        assert parse_gallons("300") == 300.0
+        assert parse_gallons("about 300 gal") is None
+        assert parse_gallons(None) is None
+
+    def test_parse_date_formats(self):
+        """Service dates parse from each supported format."""
+        from datetime import date
+
+        expected = date(2026, 1, 5)
+        assert parse_date("2026-01-05") == expected
+        assert parse_date(" 1/5/2026 ") == expected
+        assert parse_date("01-05-2026") == expected
+        assert parse_date("January 5, 2026") == expected
+        assert parse_date("Jan 5, 2026") == expected
+        assert parse_date("2026-13-05") is None
+        assert parse_date("next Tuesday") is None
+        assert parse_date(None) is None
+
+
+class TestJobPacket:
+    def test_completeness_percentage(self):
+        """Invoice and manifest each count for half of the packet."""
+        job_id = uuid4()
+        assert JobPacket(job_id).completeness_percentage == 0
+        assert JobPacket(job_id, has_manifest=True).completeness_percentage == 50
+        packet = JobPacket(job_id, has_invoice=True, has_manifest=True)
+        assert packet.completeness_percentage == 100
+        assert packet.is_complete
+
+
+class TestJobModel:
+    def test_job_from_parse_result(self):
+        """Create a Job from a ParseResult."""
+        from trap.parse import parse_text_to_record
+
+        text = "INVOICE #: TEST-001\nTOTAL DUE: $100.00"
+        result = parse_text_to_record(text)
+
+        job = Job.from_parse_result(result, source_filename="test.txt")
+
+        assert job.invoice_number == "TEST-001"
+        assert job.invoice_total_str == "$100.00"
+        assert job.invoice_total_cents == 10000  # $100.00 in cents
+        assert job.source_filename == "test.txt"
+        assert job.status == JobStatus.DRAFT
+
+    def test_record_field_text_round_trip(self):
+        """Typed record fields are edited as text and re-parsed on set."""
+        from datetime import date
+
+        job = Job(
+            service_date=date(2026, 1, 15),
+            gallons_pumped=1200.0,
+            invoice_total_cents=45000,
+        )
+        assert job.get_record_field_text("service_date") == "2026-01-15"
+        assert job.get_record_field_text("gallons_pumped") == "1,200"
+        assert job.get_record_field_text("invoice_total") == "$450.00"
+        assert job.get_record_field_text("technician") == ""
+
+        job.set_record_field_text("service_date", "02/01/2026")
+        job.set_record_field_text("gallons_pumped", "800 gal")
+        job.set_record_field_text("invoice_total", "$1,250.50")
+        job.set_record_field_text("technician", "Marcus")
+
+        assert job.service_date == date(2026, 2, 1)
+        assert job.gallons_pumped == 800.0
+        assert job.invoice_total_cents == 125050
+        assert job.technician == "Marcus"
+
+    def test_record_field_text_keeps_zero_values(self):
+        """A $0.00 total and 0 gallons are values, not blanks."""
+        job = Job(gallons_pumped=0.0, invoice_total_cents=0)
+
+        assert job.invoice_total == "$0.00"
+        assert job.get_record_field_text("invoice_total") == "$0.00"
+        assert job.get_record_field_text("gallons_pumped") == "0"
+
+    def test_can_verify_with_required_fields(self):
+        """Job can be verified when required fields are present."""
+        from datetime import date
+
+        job = Job(
+            invoice_number="TEST-001",
+            service_date=date(2026, 1, 1),
+            customer_name="Test Customer",
+        )
+        assert job.can_verify() is True
+
+    def test_cannot_verify_without_required_fields(self):
+        """Job cannot be verified when required fields are missing."""
+        job = Job(invoice_number="TEST-001")
+        assert job.can_verify() is False
+        assert "service_date" in job.get_missing_required_fields()
+        assert "customer_name" in job.get_missing_required_fields()
+
+    def test_to_dict_serialization(self):
+        """Job can be serialized to a dictionary."""
+        import json
+
+        job = Job(
+            invoice_number="SERIAL-001",
+            customer_name="Test Co",
+            status=JobStatus.VERIFIED,
+        )
+
+        d = job.to_dict()
+
+        # Should be JSON-serializable
+        json_str = json.dumps(d)
+        parsed = json.loads(json_str)
+
+        assert parsed["invoice_number"] == "SERIAL-001"
+        assert parsed["customer_name"] == "Test Co"
+        assert parsed["status"] == "Verified"
+        assert isinstance(parsed["job_id"], str)
+        assert isinstance(parsed["created_at"], str)
+
+    def test_get_record_dict(self):
+        """Record dict covers every service record field."""
+        job = Job(invoice_number="REC-001", invoice_total_cents=125050)
+
+        record = job.get_record_dict()
+
+        assert list(record) == RECORD_FIELD_NAMES
+        assert record["invoice_number"] == "REC-001"
+        assert record["invoice_total"] == "$1,250.50"
+        assert record["notes"] is None
+
+    def test_to_dict_copies_lists(self):
+        """to_dict output does not share mutable fields with the job."""
+        job = Job(extracted_fields=["invoice_number"], missing_fields=["phone"])
+
+        d = job.to_dict()
+        d["extracted_fields"].append("notes")
+
+        assert job.extracted_fields == ["invoice_number"]
+        assert d["missing_fields"] == ["phone"]
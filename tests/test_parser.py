@@ -8,6 +8,7 @@ WHY THIS FILE EXISTS:
 """
 
 import json
+import time
 from pathlib import Path
 
 from trap.parse import parse_text_to_record
@@ -88,6 +89,25 @@ def test_parse_garbage_text():
     json.dumps(result.to_dict())
 
 
+def test_parse_address_wrapped_across_lines():
+    """OCR text often wraps the street onto the next line."""
+    result = parse_text_to_record("Address: 123 Main\nStreet, Springfield, IL 62701")
+
+    assert result.record.customer_address == "123 Main\nStreet, Springfield, IL 62701"
+
+
+def test_parse_repeated_address_text_does_not_backtrack():
+    """Long runs of address-like words must not backtrack catastrophically."""
+    text = "12 Main St " * 400
+
+    start = time.perf_counter()
+    result = parse_text_to_record(text)
+
+    # Unbounded runs took tens of seconds here; the budget is generous for CI
+    assert time.perf_counter() - start < 5.0
+    assert result.record.customer_address is None
+
+
 def test_extracted_and_missing_fields_are_disjoint():
     """A field should be in extracted OR missing, never both."""
     text = (FIXTURES_DIR / "sample_invoice_1.txt").read_text()
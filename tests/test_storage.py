@@ -11,15 +11,23 @@ from uuid import uuid4
 
 import pytest
 
-from trap.models import Customer, Job, JobStatus, ServiceFrequency, Site
+from trap.models import (
+    Customer,
+    Job,
+    JobStatus,
+    ServiceFrequency,
+    Site,
+)
 from trap.storage import (
     count_customers,
     count_jobs,
     count_sites,
     delete_customer,
     delete_job,
+    get_connection,
     get_customer,
     get_dashboard_kpis,
+    get_gallons_by_date,
     get_jobs_by_date,
     get_jobs_by_status,
     get_jobs_by_technician,
@@ -29,7 +37,9 @@ from trap.storage import (
     get_unique_technicians,
     init_db,
     list_customers,
+    list_customers_summary,
     list_jobs,
+    list_jobs_summary,
     list_overdue_sites,
     list_sites,
     load_job,
@@ -194,6 +204,30 @@ class TestListJobs:
         page2_ids = {j.job_id for j in page2}
         assert page1_ids.isdisjoint(page2_ids)
 
+    def test_list_jobs_summary(self, temp_db):
+        """Summaries carry the list columns and honour the same filters."""
+        from datetime import date
+
+        job = Job(
+            invoice_number="INV-001",
+            customer_name="Tony's Restaurant",
+            service_date=date(2026, 1, 15),
+            invoice_total_cents=125050,
+            status=JobStatus.VERIFIED,
+        )
+        save_job(job, temp_db)
+        save_job(Job(invoice_number="INV-002", status=JobStatus.DRAFT), temp_db)
+
+        results = list_jobs_summary(status=JobStatus.VERIFIED, db_path=temp_db)
+        assert len(results) == 1
+        summary = results[0]
+        assert summary.job_id == str(job.job_id)
+        assert summary.invoice_number == "INV-001"
+        assert summary.customer_name == "Tony's Restaurant"
+        assert summary.status == JobStatus.VERIFIED
+        assert summary.service_date == "2026-01-15"
+        assert summary.get_invoice_total_display() == "$1,250.50"
+
 
 class TestUpdateJob:
     def test_update_single_field(self, temp_db):
@@ -234,6 +268,29 @@ class TestUpdateJob:
         updated = update_job(job.job_id, {"status": "Verified"}, temp_db)
         assert updated.status == JobStatus.VERIFIED
 
+    def test_update_record_fields_from_text(self, temp_db):
+        """Text updates to typed record fields re-derive their values."""
+        from datetime import date
+
+        job = Job(invoice_number="TEXT-001")
+        save_job(job, temp_db)
+
+        update_job(
+            job.job_id,
+            {
+                "service_date": "2026-02-03",
+                "gallons_pumped": "1,200 gallons",
+                "invoice_total": "$1,250.50",
+            },
+            temp_db,
+        )
+
+        reloaded = load_job(job.job_id, temp_db)
+        assert reloaded.service_date == date(2026, 2, 3)
+        assert reloaded.gallons_pumped == 1200
+        assert reloaded.invoice_total_cents == 125050
+        assert reloaded.get_invoice_total_display() == "$1,250.50"
+
     def test_update_nonexistent_job(self, temp_db):
         """Updating a non-existent job returns None."""
         result = update_job(uuid4(), {"customer_name": "Test"}, temp_db)
@@ -290,63 +347,6 @@ class TestResetDb:
         assert count_jobs(db_path=temp_db) == 0
 
 
-class TestJobModel:
-    def test_job_from_parse_result(self):
-        """Create a Job from a ParseResult."""
-        from trap.parse import parse_text_to_record
-
-        text = "INVOICE #: TEST-001\nTOTAL DUE: $100.00"
-        result = parse_text_to_record(text)
-
-        job = Job.from_parse_result(result, source_filename="test.txt")
-
-        assert job.invoice_number == "TEST-001"
-        assert job.invoice_total_str == "$100.00"
-        assert job.invoice_total_cents == 10000  # $100.00 in cents
-        assert job.source_filename == "test.txt"
-        assert job.status == JobStatus.DRAFT
-
-    def test_can_verify_with_required_fields(self):
-        """Job can be verified when required fields are present."""
-        from datetime import date
-
-        job = Job(
-            invoice_number="TEST-001",
-            service_date=date(2026, 1, 1),
-            customer_name="Test Customer",
-        )
-        assert job.can_verify() is True
-
-    def test_cannot_verify_without_required_fields(self):
-        """Job cannot be verified when required fields are missing."""
-        job = Job(invoice_number="TEST-001")
-        assert job.can_verify() is False
-        assert "service_date" in job.get_missing_required_fields()
-        assert "customer_name" in job.get_missing_required_fields()
-
-    def test_to_dict_serialization(self):
-        """Job can be serialized to a dictionary."""
-        import json
-
-        job = Job(
-            invoice_number="SERIAL-001",
-            customer_name="Test Co",
-            status=JobStatus.VERIFIED,
-        )
-
-        d = job.to_dict()
-
-        # Should be JSON-serializable
-        json_str = json.dumps(d)
-        parsed = json.loads(json_str)
-
-        assert parsed["invoice_number"] == "SERIAL-001"
-        assert parsed["customer_name"] == "Test Co"
-        assert parsed["status"] == "Verified"
-        assert isinstance(parsed["job_id"], str)
-        assert isinstance(parsed["created_at"], str)
-
-
 # =============================================================================
 # CUSTOMER TESTS
 # =============================================================================
@@ -422,6 +422,23 @@ class TestCustomerCRUD:
         all_customers = list_customers(active_only=False, db_path=temp_db)
         assert len(all_customers) == 2
 
+    def test_list_customers_summary(self, temp_db):
+        """Summaries carry the list columns and honour search."""
+        customer = Customer(
+            name="Tony's Pizza", phone="555-0100", email="t@example.com", city="Austin"
+        )
+        save_customer(customer, temp_db)
+        save_customer(Customer(name="Joe's Diner"), temp_db)
+
+        results = list_customers_summary(search="Tony", db_path=temp_db)
+        assert len(results) == 1
+        assert results[0].customer_id == str(customer.customer_id)
+        assert (results[0].name, results[0].phone, results[0].city) == (
+            "Tony's Pizza",
+            "555-0100",
+            "Austin",
+        )
+
     def test_update_customer(self, temp_db):
         """Update customer fields."""
         customer = Customer(name="Original Name")
@@ -439,6 +456,21 @@ class TestCustomerCRUD:
         reloaded = get_customer(customer.customer_id, temp_db)
         assert reloaded.name == "Updated Name"
 
+    def test_resave_customer_keeps_created_at(self, temp_db):
+        """Saving an existing customer updates it in place."""
+        customer = Customer(name="Original Name")
+        save_customer(customer, temp_db)
+        created_at = customer.created_at
+
+        customer.name = "Renamed"
+        customer.created_at = datetime.now() + timedelta(days=1)
+        save_customer(customer, temp_db)
+
+        reloaded = get_customer(customer.customer_id, temp_db)
+        assert reloaded.name == "Renamed"
+        assert reloaded.created_at == created_at
+        assert count_customers(db_path=temp_db) == 1
+
     def test_update_nonexistent_customer(self, temp_db):
         """Updating non-existent customer returns None."""
         result = update_customer(uuid4(), {"name": "Test"}, temp_db)
@@ -555,6 +587,51 @@ class TestSiteCRUD:
 # =============================================================================
 
 
+class TestTypedJobColumns:
+    def test_save_job_writes_typed_columns(self, temp_db):
+        """save_job stores numeric values next to the display text."""
+        job = Job(
+            invoice_number="TYPED-001",
+            service_date_str="January 5, 2026",
+            gallons_pumped_str="300 gal",
+            invoice_total_cents=125050,
+        )
+        save_job(job, temp_db)
+
+        with get_connection(temp_db) as conn:
+            row = conn.execute(
+                "SELECT service_date_typed, gallons_pumped_float, invoice_total_cents"
+                " FROM jobs"
+            ).fetchone()
+
+        assert tuple(row) == ("2026-01-05", 300.0, 125050)
+
+    def test_init_db_backfills_typed_columns(self, temp_db):
+        """Rows written before the typed columns existed are backfilled once."""
+        with get_connection(temp_db) as conn:
+            conn.execute(
+                """
+                INSERT INTO jobs (job_id, created_at, updated_at, status,
+                    service_date, gallons_pumped, invoice_total)
+                VALUES ('old', '2026-01-01T00:00:00', '2026-01-01T00:00:00',
+                    'Draft', '2026-01-05', '1,200 gallons', '$19.99')
+                """
+            )
+            conn.execute("PRAGMA user_version = 0")
+
+        init_db(temp_db)
+
+        with get_connection(temp_db) as conn:
+            row = conn.execute(
+                "SELECT service_date_typed, gallons_pumped_float, invoice_total_cents"
+                " FROM jobs"
+            ).fetchone()
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+
+        assert tuple(row) == ("2026-01-05", 1200.0, 1999)
+        assert version == 1
+
+
 class TestAnalytics:
     def test_get_dashboard_kpis(self, temp_db):
         """Get dashboard KPIs."""
@@ -591,6 +668,16 @@ class TestAnalytics:
         assert kpis.customer_count == 1
         assert kpis.site_count == 1
 
+    def test_get_dashboard_kpis_empty_db(self, temp_db):
+        """KPIs on an empty database are all zero, not None."""
+        kpis = get_dashboard_kpis(db_path=temp_db)
+
+        assert kpis.jobs_completed == 0
+        assert kpis.jobs_in_progress == 0
+        assert kpis.docs_missing_count == 0
+        assert kpis.overdue_services == 0
+        assert kpis.customer_count == 0
+
     def test_get_dashboard_kpis_with_date_filter(self, temp_db):
         """KPIs can be filtered by date range."""
         from datetime import date
@@ -636,6 +723,17 @@ class TestAnalytics:
         jan10 = next(p for p in result if p.date == "2026-01-10")
         assert jan10.value == 2
 
+    def test_get_jobs_by_date_uses_parsed_service_date(self, temp_db):
+        """Free-text service dates are filtered and grouped by their parsed date."""
+        save_job(Job(invoice_number="A", service_date_str="01/10/2026"), temp_db)
+        save_job(Job(invoice_number="B", service_date_str="January 10, 2026"), temp_db)
+
+        result = get_jobs_by_date("2026-01-01", "2026-01-31", db_path=temp_db)
+        assert [(p.date, p.value) for p in result] == [("2026-01-10", 2)]
+
+        jobs = list_jobs(date_from="2026-01-10", date_to="2026-01-10", db_path=temp_db)
+        assert len(jobs) == 2
+
     def test_get_jobs_by_status(self, temp_db):
         """Get job counts by status."""
         save_job(Job(invoice_number="A", status=JobStatus.DRAFT), temp_db)
@@ -698,6 +796,38 @@ class TestAnalytics:
         assert result[0].date == "2026-01-10"
         assert result[0].value == 300.0
 
+    def test_get_gallons_by_date(self, temp_db):
+        """Gallons totals parse both stored formats per day."""
+        from datetime import date
+
+        save_job(
+            Job(
+                invoice_number="A",
+                service_date=date(2026, 1, 10),
+                gallons_pumped=1200.0,  # stored as "1,200 gallons"
+            ),
+            temp_db,
+        )
+        save_job(
+            Job(
+                invoice_number="B",
+                service_date=date(2026, 1, 10),
+                gallons_pumped_str="300 gal",
+            ),
+            temp_db,
+        )
+        save_job(
+            Job(invoice_number="C", service_date=date(2026, 1, 12)),
+            temp_db,
+        )
+
+        result = get_gallons_by_date("2026-01-01", "2026-01-31", db_path=temp_db)
+
+        assert [(p.date, p.value) for p in result] == [
+            ("2026-01-10", 1500.0),
+            ("2026-01-12", 0.0),
+        ]
+
     def test_get_top_customers_by_revenue(self, temp_db):
         """Get top customers by revenue."""
         save_job(
@@ -733,6 +863,25 @@ class TestAnalytics:
         assert result[1][0] == "Small Customer"
         assert result[1][1] == 100.0
 
+    def test_get_top_customers_by_revenue_limit_and_missing_totals(self, temp_db):
+        """Customers without totals count as zero and the limit is applied."""
+        save_job(
+            Job(
+                invoice_number="A",
+                customer_name="Payer",
+                invoice_total_cents=123456,  # $1,234.56
+            ),
+            temp_db,
+        )
+        save_job(Job(invoice_number="B", customer_name="No Total"), temp_db)
+
+        result = get_top_customers_by_revenue(limit=10, db_path=temp_db)
+        assert result == [("Payer", 1234.56), ("No Total", 0.0)]
+
+        assert get_top_customers_by_revenue(limit=1, db_path=temp_db) == [
+            ("Payer", 1234.56)
+        ]
+
 
 class TestJobsExtended:
     def test_list_jobs_by_technician(self, temp_db):